@@ -22,6 +22,21 @@ def analyze_report(
     url: str = "api_request",
 ) -> Dict[str, Any]:
     analyzer = AccessibilityAnalyzer(use_ai=use_ai, max_ai_issues=max_ai_issues)
+    try:
+        return _build_response(analyzer, report, framework, url)
+    finally:
+        # Flush write-behind cache entries and stop the writer thread;
+        # a fresh analyzer is built per request, so leaving this to GC
+        # would leak one writer per analyzed report.
+        analyzer.close()
+
+
+def _build_response(
+    analyzer: AccessibilityAnalyzer,
+    report: Dict[str, Any],
+    framework: str,
+    url: str,
+) -> Dict[str, Any]:
     enhanced = analyzer.analyze_issues(raw_report=report, url=url, framework=framework)
 
     # Build UI-friendly issues payload
@@ -1,3 +1,4 @@
+import sys
 from typing import List, Dict, Any
 
 from ..models import AccessibilityIssue
@@ -14,20 +15,26 @@ def parse_axe_report(report: Dict[str, Any]) -> List[AccessibilityIssue]:
     if not isinstance(violations, list):
         return issues
 
+    intern = sys.intern
     for violation in violations:
+        # Selectors repeat heavily too (the same component matched on every
+        # page), so intern them alongside ids/impacts: duplicates collapse
+        # to one string object and pattern detection compares by pointer.
         elements: List[str] = []
         for node in (violation.get("nodes") or []):
             target = node.get("target", [])
             if isinstance(target, list):
-                elements.extend([str(t) for t in target])
+                elements.extend([intern(str(t)) for t in target])
             elif target:
-                elements.append(str(target))
+                elements.append(intern(str(target)))
 
+        # Intern ids/impacts: reports repeat the same handful of values, and
+        # interned strings make downstream cache-key hashing/compares cheap.
         issues.append(
             AccessibilityIssue(
-                id=str(violation.get("id", "unknown")),
+                id=sys.intern(str(violation.get("id", "unknown"))),
                 description=str(violation.get("description", "")),
-                impact=str(violation.get("impact", "moderate")),
+                impact=sys.intern(str(violation.get("impact", "moderate"))),
                 elements=elements,
             )
         )
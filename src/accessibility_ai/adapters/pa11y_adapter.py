@@ -1,3 +1,4 @@
+import sys
 from typing import List, Dict, Any
 
 from ..models import AccessibilityIssue
@@ -14,13 +15,17 @@ def parse_pa11y_report(report: Dict[str, Any]) -> List[AccessibilityIssue]:
         return issues
 
     for item in raw_issues:
+        # Selectors repeat across issues on the same page; interning them
+        # collapses duplicates to one shared string object.
         selector = item.get("selector", "")
-        elements = [selector] if selector else []
+        elements = [sys.intern(str(selector))] if selector else []
+        # Intern ids/impacts: Pa11y repeats the same codes/types across issues,
+        # and interned strings make downstream cache-key hashing/compares cheap.
         issues.append(
             AccessibilityIssue(
-                id=str(item.get("code", "unknown")),
+                id=sys.intern(str(item.get("code", "unknown"))),
                 description=str(item.get("message", "")),
-                impact=str(item.get("type", "moderate")),
+                impact=sys.intern(str(item.get("type", "moderate"))),
                 elements=elements,
             )
         )
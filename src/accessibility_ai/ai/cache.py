@@ -2,8 +2,10 @@ import json
 import sqlite3
 import hashlib
 import logging
+import queue
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -17,12 +19,17 @@ class AICache:
     - Automatic expiration of old entries
     - Cleanup of stale data
     - Thread-safe operations
+    - Write-behind queue so writes stay off the caller's hot path
     """
 
+    # Flush the write-behind queue after this many pending entries or seconds.
+    _WRITE_BATCH_SIZE = 100
+    _WRITE_FLUSH_INTERVAL = 1.0
+
     def __init__(self, db_path: Path, ttl_days: int = 30) -> None:
         """
         Initialize cache with expiration support.
-        
+
         Args:
             db_path: Path to SQLite database file
             ttl_days: Time-to-live in days (default: 30 days)
@@ -31,6 +38,14 @@ class AICache:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.ttl_days = ttl_days
         self._ensure()
+        # Background writer: set_async() enqueues, the writer thread commits
+        # in batches so the analysis loop never waits on SQLite. Started
+        # lazily on the first set_async — the backend builds a fresh
+        # analyzer (and cache) per request, and read-only callers must not
+        # each leak a polling thread for writes they never make.
+        self._write_queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
 
     def _ensure(self) -> None:
         """Create cache table with expiration tracking and handle migrations."""
@@ -128,7 +143,85 @@ class AICache:
             logger.debug(f"Cache SET for key {key[:16]}... (expires: {expires_at})")
         finally:
             conn.close()
-    
+
+    def set_async(self, key: str, value: str) -> None:
+        """
+        Enqueue a value for background persistence (fire-and-forget).
+
+        The write happens on the writer thread, batched with other pending
+        entries, so callers never block on SQLite commits.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be string/JSON)
+        """
+        self._ensure_writer()
+        self._write_queue.put((key, value))
+
+    def _ensure_writer(self) -> None:
+        """Start the writer thread on first use (double-checked lock)."""
+        if self._writer_thread is None:
+            with self._writer_lock:
+                if self._writer_thread is None:
+                    thread = threading.Thread(
+                        target=self._writer_loop, name="AICache-writer", daemon=True
+                    )
+                    thread.start()
+                    self._writer_thread = thread
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue, committing batches in one transaction."""
+        while True:
+            batch: List[Tuple[str, str]] = []
+            try:
+                item = self._write_queue.get(timeout=self._WRITE_FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is None:  # Shutdown sentinel
+                break
+            batch.append(item)
+            # Opportunistically grab whatever else is pending, up to the batch cap
+            while len(batch) < self._WRITE_BATCH_SIZE:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._write_batch(batch)
+                    return
+                batch.append(item)
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Tuple[str, str]]) -> None:
+        """Persist a batch of (key, value) pairs in a single transaction."""
+        if not batch:
+            return
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                expires_at = (datetime.now() + timedelta(days=self.ttl_days)).isoformat()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache(key, value, expires_at) VALUES(?, ?, ?)",
+                    [(key, value, expires_at) for key, value in batch],
+                )
+                conn.commit()
+                logger.debug(f"Cache flushed {len(batch)} write-behind entries")
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Write-behind cache flush failed: {e}")
+
+    def close(self) -> None:
+        """Drain pending write-behind entries and stop the writer thread.
+
+        A no-op when no write ever started the writer.
+        """
+        if self._writer_thread is None:
+            return
+        self._write_queue.put(None)
+        self._writer_thread.join(timeout=5.0)
+
+
     def cleanup_expired(self) -> int:
         """
         Remove all expired entries from cache.
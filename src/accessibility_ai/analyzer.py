@@ -1,5 +1,6 @@
 ﻿from typing import List, Dict, Any, Optional, Union
 import logging
+import sys
 
 from .models import (
     AccessibilityIssue,
@@ -19,6 +20,57 @@ from .prioritizer import IssuePrioritizer
 
 logger = logging.getLogger(__name__)
 
+# Keys that mark a list of dicts as issue-like in the generic fallback parser.
+_SIGNAL_KEYS = frozenset({"id", "description", "impact"})
+
+# Precomputed lookup avoids the exception cost of Priority(value) on the
+# free-form strings AI responses sometimes return.
+_PRIORITY_MAP = {p.value: p for p in Priority}
+
+
+def _coerce_effort(v: Any, default: int = 15) -> int:
+    """Coerce an effort-minutes value without raising on junk input."""
+    if isinstance(v, int) and not isinstance(v, bool):
+        return v
+    if isinstance(v, str) and v.isdigit():
+        return int(v)
+    return default
+
+
+def _group_key(item: AccessibilityIssue) -> Any:
+    """Cache/grouping key: rule id, trimmed description/impact, first selectors.
+
+    The description slice and impact are interned so duplicate violations
+    share one string object and tuple-key compares shortcut on identity.
+    """
+    desc = sys.intern((item.description or "").strip().lower()[:200])
+    impact = sys.intern((item.impact or "").strip().lower())
+    top_elems = tuple((item.elements or [])[:3])
+    return (item.id, desc, impact, top_elems)
+
+
+def _as_list_str(v: Any) -> List[str]:
+    if isinstance(v, list):
+        return [str(x) for x in v]
+    if v is None:
+        return []
+    return [str(v)]
+
+
+def _as_opt_dict(v: Any) -> Optional[Dict[str, Any]]:
+    return v if isinstance(v, dict) else None
+
+
+def _as_opt_str(v: Any) -> Optional[str]:
+    return str(v) if v is not None else None
+
+
+def _as_opt_int(v: Any) -> Optional[int]:
+    try:
+        return int(v) if v is not None else None
+    except (TypeError, ValueError):
+        return None
+
 
 class AccessibilityAnalyzer:
     """Main analysis engine for processing accessibility reports."""
@@ -61,7 +113,7 @@ class AccessibilityAnalyzer:
                 if self._persistent_cache:
                     self._persistent_cache.cleanup_expired()
             except Exception as e:
-                logger.warning(f"Failed to initialize persistent cache: {e}")
+                logger.warning("Failed to initialize persistent cache: %s", e)
                 self._persistent_cache = None
 
         if use_ai:
@@ -85,7 +137,7 @@ class AccessibilityAnalyzer:
                     logger.info("AI not available - using rule-based analysis")
                     return False
             except Exception as e:
-                logger.warning(f"AI client initialization failed: {e}")
+                logger.warning("AI client initialization failed: %s", e)
                 self._ai_initialized = True  # Don't retry
                 return False
 
@@ -100,7 +152,7 @@ class AccessibilityAnalyzer:
         """
         Parse the raw report and return a list of EnhancedIssue objects.
         """
-        logger.info(f"Starting analysis for {url}")
+        logger.info("Starting analysis for %s", url)
         # Persist the framework for AI prompts
         try:
             self._framework = framework
@@ -109,7 +161,7 @@ class AccessibilityAnalyzer:
 
         # Extract normalized issues
         issues = self._extract_issues(raw_report)
-        logger.info(f"Extracted {len(issues)} issues from report")
+        logger.info("Extracted %d issues from report", len(issues))
 
         # Reset AI usage tracking
         self._ai_calls_used = 0
@@ -119,12 +171,12 @@ class AccessibilityAnalyzer:
         enhanced: List[EnhancedIssue] = []
         processed_groups = 0
 
-        def _group_key(item: AccessibilityIssue) -> Any:
-            # Group by rule/description and first few selectors
-            desc = (item.description or "").strip().lower()[:200]
-            impact = (item.impact or "").strip().lower()
-            top_elems = tuple((item.elements or [])[:3])
-            return (item.id, desc, impact, top_elems)
+        # Shared gating context; only ai_calls_used changes between iterations.
+        context = {
+            "framework": self._framework,
+            "ai_calls_used": self._ai_calls_used,
+            "max_ai_calls": self.max_ai_issues or 5,
+        }
 
         for issue in issues:
             key = _group_key(issue)
@@ -178,12 +230,8 @@ class AccessibilityAnalyzer:
                 continue
 
             # Gate by heuristics (only trigger AI for valuable cases)
-            context = {
-                "framework": self._framework,
-                "ai_calls_used": self._ai_calls_used,
-                "max_ai_calls": self.max_ai_issues or 5,
-            }
-            
+            context["ai_calls_used"] = self._ai_calls_used
+
             if self._prioritizer.should_enrich(issue, context):
                 # Budget check: only call AI for up to max_ai_issues unique groups
                 budget_ok = self.max_ai_issues is None or processed_groups < self.max_ai_issues
@@ -198,7 +246,9 @@ class AccessibilityAnalyzer:
                             pkey = AICache.make_key(*(list(key) + [self._framework, PROMPT_VERSION]))
                             payload = self._ai_analysis_to_raw(ei.ai_analysis)
                             if self._persistent_cache is not None:
-                                self._persistent_cache.set(pkey, json.dumps(payload, ensure_ascii=False))  # type: ignore[attr-defined]
+                                # Fire-and-forget: the cache's writer thread persists it;
+                                # re-reads during this run hit _ai_cache in memory.
+                                self._persistent_cache.set_async(pkey, json.dumps(payload, ensure_ascii=False))  # type: ignore[attr-defined]
                         except Exception:
                             pass
                     enhanced.append(ei)
@@ -221,7 +271,12 @@ class AccessibilityAnalyzer:
                     )
                 )
 
-        logger.info(f"Analysis completed: {self._rule_db_hits} from rule DB, {self._ai_calls_used} from AI, {len(enhanced) - self._rule_db_hits - self._ai_calls_used} generic fallback")
+        logger.info(
+            "Analysis completed: %d from rule DB, %d from AI, %d generic fallback",
+            self._rule_db_hits,
+            self._ai_calls_used,
+            len(enhanced) - self._rule_db_hits - self._ai_calls_used,
+        )
         return enhanced
 
     def _extract_issues(self, raw_report: Dict[str, Any]) -> List[AccessibilityIssue]:
@@ -273,7 +328,7 @@ class AccessibilityAnalyzer:
             for _, value in raw_report.items():
                 if isinstance(value, list) and value and isinstance(value[0], dict):
                     sample = value[0]
-                    if any(k in sample for k in ("id", "description", "impact")):
+                    if sample.keys() & _SIGNAL_KEYS:
                         for item in value:
                             els = item.get("elements", [])
                             if not isinstance(els, list):
@@ -331,7 +386,7 @@ class AccessibilityAnalyzer:
                 effort_minutes=self._rule_db.get_effort_estimate(rule_id),
             )
         except Exception as e:
-            logger.warning(f"Failed to build analysis from rule database for {rule_id}: {e}")
+            logger.warning("Failed to build analysis from rule database for %s: %s", rule_id, e)
             return None
 
     def _enhance_issue_with_ai(self, issue: AccessibilityIssue) -> EnhancedIssue:
@@ -356,59 +411,32 @@ class AccessibilityAnalyzer:
                 ) or {}
                 # Coerce/validate AI fields defensively
                 prio_raw = (ai_raw.get("priority") or "medium").lower()
-                try:
-                    prio = Priority(prio_raw)
-                except ValueError:
-                    prio = Priority.MEDIUM
-
-                effort_raw = ai_raw.get("effort_minutes", 15)
-                try:
-                    effort_val = int(effort_raw)
-                except (TypeError, ValueError):
-                    effort_val = 15
-
-                # Safely coerce optional list/dict fields
-                def as_list_str(v: Any) -> List[str]:
-                    if isinstance(v, list):
-                        return [str(x) for x in v]
-                    if v is None:
-                        return []
-                    return [str(v)]
-
-                def as_opt_dict(v: Any) -> Optional[Dict[str, Any]]:
-                    return v if isinstance(v, dict) else None
-
-                def as_opt_str(v: Any) -> Optional[str]:
-                    return str(v) if v is not None else None
-
-                def as_opt_int(v: Any) -> Optional[int]:
-                    try:
-                        return int(v) if v is not None else None
-                    except (TypeError, ValueError):
-                        return None
+                prio = _PRIORITY_MAP.get(prio_raw, Priority.MEDIUM)
+                effort_val = _coerce_effort(ai_raw.get("effort_minutes", 15))
 
+                # Safely coerce optional list/dict fields (module-level helpers)
                 ai_analysis = AIAnalysis(
                     priority=prio,
                     user_impact=str(ai_raw.get("user_impact", "")),
                     fix_suggestion=str(ai_raw.get("fix_suggestion", "")),
                     effort_minutes=effort_val,
-                    code_example=as_opt_str(ai_raw.get("code_example")),
-                    wcag_refs=as_list_str(ai_raw.get("wcag_refs")),
-                    acceptance_criteria=as_list_str(ai_raw.get("acceptance_criteria")),
-                    test_steps=as_list_str(ai_raw.get("test_steps")),
-                    automation_hints=as_list_str(ai_raw.get("automation_hints")),
-                    personas_impact=as_opt_dict(ai_raw.get("personas_impact")),
-                    root_cause_hypothesis=as_opt_str(ai_raw.get("root_cause_hypothesis")),
-                    component_guess=as_opt_str(ai_raw.get("component_guess")),
-                    fix_plan=as_opt_dict(ai_raw.get("fix_plan")),
-                    ticket_title=as_opt_str(ai_raw.get("ticket_title")),
-                    ticket_body=as_opt_str(ai_raw.get("ticket_body")),
-                    confidence=as_opt_int(ai_raw.get("confidence")),
-                    risk_level=as_opt_str(ai_raw.get("risk_level")),
+                    code_example=_as_opt_str(ai_raw.get("code_example")),
+                    wcag_refs=_as_list_str(ai_raw.get("wcag_refs")),
+                    acceptance_criteria=_as_list_str(ai_raw.get("acceptance_criteria")),
+                    test_steps=_as_list_str(ai_raw.get("test_steps")),
+                    automation_hints=_as_list_str(ai_raw.get("automation_hints")),
+                    personas_impact=_as_opt_dict(ai_raw.get("personas_impact")),
+                    root_cause_hypothesis=_as_opt_str(ai_raw.get("root_cause_hypothesis")),
+                    component_guess=_as_opt_str(ai_raw.get("component_guess")),
+                    fix_plan=_as_opt_dict(ai_raw.get("fix_plan")),
+                    ticket_title=_as_opt_str(ai_raw.get("ticket_title")),
+                    ticket_body=_as_opt_str(ai_raw.get("ticket_body")),
+                    confidence=_as_opt_int(ai_raw.get("confidence")),
+                    risk_level=_as_opt_str(ai_raw.get("risk_level")),
                 )
                 analysis_source = "ai_enhanced"
             except Exception as e:
-                logger.warning(f"AI enhancement failed for {issue.id}: {e}")
+                logger.warning("AI enhancement failed for %s: %s", issue.id, e)
                 # Increment failure count and possibly disable AI for the rest of the run
                 fail_count = getattr(self, "_ai_failures", 0) + 1
                 self._ai_failures = fail_count
@@ -446,16 +474,19 @@ class AccessibilityAnalyzer:
 
         total = crit = high = med = low = ai_count = 0
         total_minutes = 0
+        # Bind enum members to locals: avoids repeated LOAD_GLOBAL/LOAD_ATTR
+        # in what is the hottest loop for large result lists.
+        p_critical, p_high, p_medium = Priority.CRITICAL, Priority.HIGH, Priority.MEDIUM
         for issue in result:
             if not isinstance(issue, EnhancedIssue):
                 raise ValueError("All items must be EnhancedIssue")
             total += 1
             pr = issue.priority
-            if pr == Priority.CRITICAL:
+            if pr == p_critical:
                 crit += 1
-            elif pr == Priority.HIGH:
+            elif pr == p_high:
                 high += 1
-            elif pr == Priority.MEDIUM:
+            elif pr == p_medium:
                 med += 1
             else:
                 low += 1
@@ -489,48 +520,26 @@ class AccessibilityAnalyzer:
     def _build_ai_analysis_from_ai_raw(self, ai_raw: Dict[str, Any]) -> AIAnalysis:
         """Build full AIAnalysis from cached/raw dict (persistent cache)."""
         prio_raw = (ai_raw.get("priority") or "medium").lower()
-        try:
-            prio = Priority(prio_raw)
-        except ValueError:
-            prio = Priority.MEDIUM
-        effort_raw = ai_raw.get("effort_minutes", 15)
-        try:
-            effort_val = int(effort_raw)
-        except (TypeError, ValueError):
-            effort_val = 15
-        def as_list_str(v: Any) -> List[str]:
-            if isinstance(v, list):
-                return [str(x) for x in v]
-            if v is None:
-                return []
-            return [str(v)]
-        def as_opt_dict(v: Any) -> Optional[Dict[str, Any]]:
-            return v if isinstance(v, dict) else None
-        def as_opt_str(v: Any) -> Optional[str]:
-            return str(v) if v is not None else None
-        def as_opt_int(v: Any) -> Optional[int]:
-            try:
-                return int(v) if v is not None else None
-            except (TypeError, ValueError):
-                return None
+        prio = _PRIORITY_MAP.get(prio_raw, Priority.MEDIUM)
+        effort_val = _coerce_effort(ai_raw.get("effort_minutes", 15))
         return AIAnalysis(
             priority=prio,
             user_impact=str(ai_raw.get("user_impact", "")),
             fix_suggestion=str(ai_raw.get("fix_suggestion", "")),
             effort_minutes=effort_val,
-            code_example=as_opt_str(ai_raw.get("code_example")),
-            wcag_refs=as_list_str(ai_raw.get("wcag_refs")),
-            acceptance_criteria=as_list_str(ai_raw.get("acceptance_criteria")),
-            test_steps=as_list_str(ai_raw.get("test_steps")),
-            automation_hints=as_list_str(ai_raw.get("automation_hints")),
-            personas_impact=as_opt_dict(ai_raw.get("personas_impact")),
-            root_cause_hypothesis=as_opt_str(ai_raw.get("root_cause_hypothesis")),
-            component_guess=as_opt_str(ai_raw.get("component_guess")),
-            fix_plan=as_opt_dict(ai_raw.get("fix_plan")),
-            ticket_title=as_opt_str(ai_raw.get("ticket_title")),
-            ticket_body=as_opt_str(ai_raw.get("ticket_body")),
-            confidence=as_opt_int(ai_raw.get("confidence")),
-            risk_level=as_opt_str(ai_raw.get("risk_level")),
+            code_example=_as_opt_str(ai_raw.get("code_example")),
+            wcag_refs=_as_list_str(ai_raw.get("wcag_refs")),
+            acceptance_criteria=_as_list_str(ai_raw.get("acceptance_criteria")),
+            test_steps=_as_list_str(ai_raw.get("test_steps")),
+            automation_hints=_as_list_str(ai_raw.get("automation_hints")),
+            personas_impact=_as_opt_dict(ai_raw.get("personas_impact")),
+            root_cause_hypothesis=_as_opt_str(ai_raw.get("root_cause_hypothesis")),
+            component_guess=_as_opt_str(ai_raw.get("component_guess")),
+            fix_plan=_as_opt_dict(ai_raw.get("fix_plan")),
+            ticket_title=_as_opt_str(ai_raw.get("ticket_title")),
+            ticket_body=_as_opt_str(ai_raw.get("ticket_body")),
+            confidence=_as_opt_int(ai_raw.get("confidence")),
+            risk_level=_as_opt_str(ai_raw.get("risk_level")),
         )
 
     def _ai_analysis_to_raw(self, ai: AIAnalysis) -> Dict[str, Any]:
@@ -555,6 +564,15 @@ class AccessibilityAnalyzer:
             "risk_level": ai.risk_level,
         }
     
+    def close(self) -> None:
+        """Flush pending persistent-cache writes. Safe to call multiple times."""
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.close()
+            except Exception as e:
+                logger.warning("Failed to close persistent cache: %s", e)
+            self._persistent_cache = None
+
     def get_ai_usage_stats(self) -> Dict[str, Any]:
         """
         Get statistics about AI usage in the last analysis.
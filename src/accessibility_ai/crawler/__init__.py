@@ -0,0 +1,21 @@
+from .axe_crawler import scan_site, scan_site_async
+from .browser_pool import BrowserPool, get_browser_pool
+from .pa11y_scanner import (
+    check_pa11y_installed,
+    scan_multiple_urls_sync,
+    scan_sitemap_with_pa11y,
+    scan_url_sync,
+    scan_url_with_pa11y,
+)
+
+__all__ = [
+    "scan_site",
+    "scan_site_async",
+    "BrowserPool",
+    "get_browser_pool",
+    "check_pa11y_installed",
+    "scan_url_with_pa11y",
+    "scan_sitemap_with_pa11y",
+    "scan_url_sync",
+    "scan_multiple_urls_sync",
+]
@@ -0,0 +1,338 @@
+"""
+Playwright-based site crawler that runs axe-core on every page it visits.
+
+Produces an axe-style report dict ("violations" list) that feeds straight
+into AccessibilityAnalyzer.analyze_issues. Crawling is concurrent: a bounded
+pool of worker pages drains a shared URL queue, so navigation and axe
+evaluation for different pages overlap instead of serializing.
+
+Requires the optional `playwright` dependency (install the `scanner` extra
+and run `playwright install chromium`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urljoin, urlsplit
+
+from .browser_pool import BrowserPool
+
+logger = logging.getLogger(__name__)
+
+AXE_CDN = "https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.8.2/axe.min.js"
+
+# How long to wait for a page navigation (milliseconds).
+NAV_TIMEOUT_MS = 30000
+
+# Recycle a worker's browser context after this many pages to keep RSS
+# bounded on long crawls.
+CONTEXT_RECYCLE_PAGES = 25
+
+# Tabs each worker keeps open. axe runs inside the page's JS VM, so firing
+# it across several tabs at once lets Chromium spread the CPU-bound phase
+# over its renderer processes instead of idling between pages.
+PAGES_PER_WORKER = 3
+
+# Links the crawler should never navigate to: non-HTTP schemes and
+# static/binary assets that cost a full page.goto + axe attempt each.
+_SKIP_SCHEMES = {"mailto", "tel", "javascript", "data"}
+_SKIP_EXT = (
+    ".pdf", ".zip", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico",
+    ".css", ".js", ".mp4", ".webm", ".webp", ".woff", ".woff2",
+)
+
+# axe-core source, fetched once per process and injected inline so pages
+# never re-download ~500KB of JS from the CDN.
+_AXE_JS: Optional[str] = None
+_AXE_VENDOR_PATH = Path(__file__).parent / "vendor" / "axe.min.js"
+
+
+def _get_axe_js() -> str:
+    """Return the axe-core source, preferring a vendored copy over the CDN."""
+    global _AXE_JS
+    if _AXE_JS is None:
+        if _AXE_VENDOR_PATH.exists():
+            _AXE_JS = _AXE_VENDOR_PATH.read_text(encoding="utf-8")
+        else:
+            import requests
+
+            resp = requests.get(AXE_CDN, timeout=30)
+            resp.raise_for_status()
+            _AXE_JS = resp.text
+    return _AXE_JS
+
+
+def _normalize_url(url: str) -> str:
+    """Drop fragments and trailing slashes so duplicates dedup cleanly."""
+    url = url.split("#", 1)[0]
+    if url.endswith("/"):
+        url = url.rstrip("/")
+    return url
+
+
+async def _scan_page(page: Any, url: str) -> "tuple[Dict[str, Any], List[str]]":
+    """Navigate to a URL and return (axe results, page hrefs).
+
+    axe run and link extraction happen in one page.evaluate so each URL
+    costs a single CDP round trip instead of two.
+    """
+    # axe is pre-loaded on every navigation via context.add_init_script.
+    await page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT_MS)
+    payload = await page.evaluate(
+        """async () => {
+            const results = await window.axe.run(document, {resultTypes: ['violations']});
+            const hrefs = [...document.querySelectorAll('a[href]')]
+                .map(a => a.getAttribute('href'))
+                .filter(Boolean);
+            return {results, hrefs};
+        }"""
+    )
+    payload = payload or {}
+    return payload.get("results") or {}, payload.get("hrefs") or []
+
+
+async def _crawl(
+    start_url: str,
+    max_pages: int = 10,
+    same_origin_only: bool = True,
+    max_concurrent: int = 4,
+    pool: Optional[BrowserPool] = None,
+) -> Dict[str, Any]:
+    """
+    Crawl from start_url, running axe on up to max_pages same-origin pages.
+
+    A pool of max_concurrent worker pages shares one browser context and a
+    URL queue, mirroring the max_concurrent pattern used by the Pa11y
+    scanner. Shared crawl state (visited set, aggregated report) is guarded
+    by an asyncio.Lock. When a BrowserPool is passed, its already-warm
+    browser is reused; otherwise an ephemeral pool is created and shut
+    down when the crawl finishes.
+    """
+    owns_pool = pool is None
+    if pool is None:
+        pool = BrowserPool(pool_size=max_concurrent, init_script=_get_axe_js())
+        await pool.warmup()
+
+    # Same-origin checks compare against this tuple; computed once rather
+    # than re-reading attributes off a parse result per link.
+    origin_parts = urlsplit(start_url)
+    origin_key = (origin_parts.scheme, origin_parts.netloc)
+    aggregated: Dict[str, Any] = {"violations": [], "pages": []}
+    visited: Set[str] = set()
+    # URLs enqueued but not yet scanned; deduping at enqueue time keeps the
+    # queue O(pages) instead of O(links) on heavily interlinked sites.
+    in_queue: Set[str] = set()
+    lock = asyncio.Lock()
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    start_norm = _normalize_url(start_url)
+    in_queue.add(start_norm)
+    await queue.put(start_norm)
+
+    try:
+
+        async def worker() -> None:
+            # Each worker owns a context so it can recycle independently;
+            # Playwright leaks memory on contexts that live for whole crawls.
+            context = await pool.acquire()
+            pages = [await context.new_page() for _ in range(PAGES_PER_WORKER)]
+            pages_in_ctx = 0
+
+            async def replace_context(preserve_state: bool) -> None:
+                nonlocal context, pages, pages_in_ctx
+                for p in pages:
+                    try:
+                        await p.close()
+                    except Exception:
+                        pass
+                context = await pool.recycle(context, preserve_state=preserve_state)
+                pages = [await context.new_page() for _ in range(PAGES_PER_WORKER)]
+                pages_in_ctx = 0
+
+            try:
+                while True:
+                    # Block for one URL, then drain up to a tab's worth more
+                    # so the whole batch navigates and runs axe in parallel.
+                    batch = [await queue.get()]
+                    while len(batch) < len(pages):
+                        try:
+                            batch.append(queue.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
+                    try:
+                        to_scan: List[str] = []
+                        async with lock:
+                            for url in batch:
+                                in_queue.discard(url)
+                                if url in visited or len(visited) >= max_pages:
+                                    continue
+                                visited.add(url)
+                                to_scan.append(url)
+                        if not to_scan:
+                            continue
+
+                        if pages_in_ctx >= CONTEXT_RECYCLE_PAGES:
+                            await replace_context(preserve_state=True)
+
+                        scans = await asyncio.gather(
+                            *(_scan_page(p, u) for p, u in zip(pages, to_scan)),
+                            return_exceptions=True,
+                        )
+                        pages_in_ctx += len(to_scan)
+
+                        scan_failed = False
+                        for url, scanned in zip(to_scan, scans):
+                            if isinstance(scanned, BaseException):
+                                logger.warning("Failed to scan %s: %s", url, scanned)
+                                scan_failed = True
+                                continue
+                            results, hrefs = scanned
+
+                            page_violations = (results or {}).get("violations", [])
+                            async with lock:
+                                aggregated_violations = aggregated["violations"]
+                                for v in page_violations:
+                                    vget = v.get
+                                    nodes = []
+                                    nodes_append = nodes.append
+                                    for n in vget("nodes", []):
+                                        tgt = n.get("target", [])
+                                        if not isinstance(tgt, list):
+                                            tgt = [tgt]
+                                        nodes_append(
+                                            {"target": [f"{url} :: {t}" for t in tgt]}
+                                        )
+                                    aggregated_violations.append(
+                                        {
+                                            "id": vget("id", "unknown"),
+                                            "description": vget("description", ""),
+                                            "impact": vget("impact", "moderate"),
+                                            "nodes": nodes,
+                                        }
+                                    )
+                                aggregated["pages"].append(
+                                    {"url": url, "violations": len(page_violations)}
+                                )
+
+                            for href in hrefs:
+                                # Cheap scheme check before any URL parsing:
+                                # mailto:/tel:/javascript:/data: links and pure
+                                # anchors are never worth a navigation.
+                                if not href or href.startswith("#"):
+                                    continue
+                                scheme_end = href.find(":")
+                                if scheme_end > 0 and href[:scheme_end] in _SKIP_SCHEMES:
+                                    continue
+                                absolute = urljoin(url + "/", href)
+                                # urlsplit skips params parsing that urlparse does
+                                # and this loop never needs.
+                                parts = urlsplit(absolute)
+                                if same_origin_only and (parts.scheme, parts.netloc) != origin_key:
+                                    continue
+                                if parts.path.lower().endswith(_SKIP_EXT):
+                                    continue
+                                norm = _normalize_url(absolute)
+                                async with lock:
+                                    if norm not in visited and norm not in in_queue:
+                                        in_queue.add(norm)
+                                        await queue.put(norm)
+
+                        if scan_failed:
+                            # One or more tabs may be wedged; swap the whole
+                            # context rather than letting later batches fail.
+                            await replace_context(preserve_state=False)
+                    finally:
+                        for _ in batch:
+                            queue.task_done()
+            finally:
+                for p in pages:
+                    try:
+                        await p.close()
+                    except Exception:
+                        pass
+                await pool.release(context)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrent)]
+        join_task = asyncio.create_task(queue.join())
+        try:
+            # Supervise the workers alongside the join: a worker that dies
+            # outside its per-batch finally (pool.acquire/new_page failing
+            # at startup, replace_context raising after a browser crash)
+            # leaves queued URLs unmarked, and a bare queue.join() would
+            # park forever. Waiting on both propagates the fatal error so
+            # a dead browser fails the crawl instead of deadlocking it.
+            pending = {join_task, *workers}
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if join_task in done:
+                    break
+                for task in done:
+                    exc = task.exception()
+                    if exc is not None:
+                        raise exc
+                if pending == {join_task}:
+                    # Workers only return via cancellation or exception,
+                    # but never hang on the queue if that ever changes.
+                    raise RuntimeError(
+                        "all crawler workers exited before the URL queue drained"
+                    )
+        finally:
+            join_task.cancel()
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(join_task, *workers, return_exceptions=True)
+    finally:
+        if owns_pool:
+            await pool.shutdown()
+
+    logger.info(
+        "Crawl of %s finished: %d pages, %d violations",
+        start_url,
+        len(aggregated["pages"]),
+        len(aggregated["violations"]),
+    )
+    return aggregated
+
+
+async def scan_site_async(
+    start_url: str,
+    max_pages: int = 10,
+    same_origin_only: bool = True,
+    max_concurrent: int = 4,
+    pool: Optional[BrowserPool] = None,
+) -> Dict[str, Any]:
+    """
+    Crawl a site and return an axe-style report.
+
+    Long-lived callers (e.g. request handlers) should pass a warmed-up
+    BrowserPool created with init_script=_get_axe_js() so the Chromium
+    cold start is paid once, not per scan.
+    """
+    return await _crawl(
+        start_url,
+        max_pages=max_pages,
+        same_origin_only=same_origin_only,
+        max_concurrent=max_concurrent,
+        pool=pool,
+    )
+
+
+def scan_site(
+    start_url: str,
+    max_pages: int = 10,
+    same_origin_only: bool = True,
+    max_concurrent: int = 4,
+) -> Dict[str, Any]:
+    """Synchronous entry point: crawl a site and return an axe-style report."""
+    return asyncio.run(
+        scan_site_async(
+            start_url,
+            max_pages=max_pages,
+            same_origin_only=same_origin_only,
+            max_concurrent=max_concurrent,
+        )
+    )
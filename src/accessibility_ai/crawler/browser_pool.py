@@ -0,0 +1,162 @@
+"""
+Long-lived Playwright browser shared across scans.
+
+Launching Chromium is by far the most expensive step of a scan (0.5-2s),
+so server-style callers should keep one BrowserPool alive and pass it to
+scan_site_async instead of paying the cold start per call. Contexts are
+recycled after a bounded number of uses to dodge Playwright's memory-leak
+pattern on long-lived contexts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, FrozenSet, Optional
+
+logger = logging.getLogger(__name__)
+
+# Resource types aborted at the context routing layer by default. axe only
+# inspects the DOM and computed styles, so images, video/audio and web
+# fonts are pure bandwidth; stylesheets stay enabled because color-contrast
+# rules need them.
+BLOCKED_RESOURCE_TYPES: FrozenSet[str] = frozenset({"image", "media", "font"})
+
+
+class BrowserPool:
+    """Pool of browser contexts on top of a single long-lived Chromium."""
+
+    def __init__(
+        self,
+        pool_size: int = 2,
+        recycle_after: int = 25,
+        init_script: Optional[str] = None,
+        blocked_resource_types: FrozenSet[str] = BLOCKED_RESOURCE_TYPES,
+    ) -> None:
+        """
+        Args:
+            pool_size: Number of browser contexts kept ready.
+            recycle_after: Close and replace a context after this many uses.
+            init_script: JS source injected into every context (e.g. axe-core).
+            blocked_resource_types: Request resource types aborted before
+                download. Pass frozenset() to disable blocking.
+        """
+        self.pool_size = pool_size
+        self.recycle_after = recycle_after
+        self.init_script = init_script
+        self.blocked_resource_types = blocked_resource_types
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._contexts: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._uses: Dict[int, int] = {}
+        self._started = False
+
+    async def warmup(self) -> None:
+        """Launch the browser and pre-create the context pool."""
+        if self._started:
+            return
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError as e:
+            raise RuntimeError(
+                "Site crawling requires playwright. Install with "
+                "`pip install ai-accessibility-suite-assitant[scanner]` and run "
+                "`playwright install chromium`."
+            ) from e
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        for _ in range(self.pool_size):
+            await self._contexts.put(await self._new_context())
+        self._started = True
+        logger.info("Browser pool warmed up (%d contexts)", self.pool_size)
+
+    async def _new_context(self, storage_state: Optional[Any] = None) -> Any:
+        context = await self._browser.new_context(storage_state=storage_state)
+        if self.init_script:
+            await context.add_init_script(self.init_script)
+        if self.blocked_resource_types:
+            # Context-level routing (not page.route, which leaks handlers on
+            # long-lived pages); contexts are recycled periodically anyway.
+            blocked = self.blocked_resource_types
+
+            async def _route_handler(route: Any) -> None:
+                if route.request.resource_type in blocked:
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.route("**/*", _route_handler)
+        self._uses[id(context)] = 0
+        return context
+
+    async def recycle(self, context: Any, preserve_state: bool = False) -> Any:
+        """
+        Close a borrowed context and hand back a fresh one immediately.
+
+        Used by long crawls to cap Playwright's per-context memory growth
+        without returning the context to the queue. With preserve_state,
+        cookies/localStorage carry over to the replacement.
+        """
+        storage_state = None
+        if preserve_state:
+            try:
+                storage_state = await context.storage_state()
+            except Exception as e:
+                logger.warning("Could not capture storage state on recycle: %s", e)
+        self._uses.pop(id(context), None)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning("Failed to close recycled context: %s", e)
+        return await self._new_context(storage_state=storage_state)
+
+    async def acquire(self) -> Any:
+        """Borrow a context from the pool (awaits if all are in use)."""
+        if not self._started:
+            await self.warmup()
+        return await self._contexts.get()
+
+    async def release(self, context: Any) -> None:
+        """Return a context, recycling it once it has served recycle_after uses."""
+        uses = self._uses.get(id(context), 0) + 1
+        if uses >= self.recycle_after:
+            self._uses.pop(id(context), None)
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning("Failed to close recycled context: %s", e)
+            context = await self._new_context()
+        else:
+            self._uses[id(context)] = uses
+        await self._contexts.put(context)
+
+    async def shutdown(self) -> None:
+        """Close all contexts, the browser and the Playwright driver."""
+        if not self._started:
+            return
+        while not self._contexts.empty():
+            try:
+                await self._contexts.get_nowait().close()
+            except Exception:
+                pass
+        self._uses.clear()
+        try:
+            await self._browser.close()
+        finally:
+            await self._playwright.stop()
+        self._browser = None
+        self._playwright = None
+        self._started = False
+        logger.info("Browser pool shut down")
+
+
+# Shared pool for callers that live on one event loop (e.g. the API server).
+_default_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool(**kwargs: Any) -> BrowserPool:
+    """Return the process-wide BrowserPool, creating it on first use."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = BrowserPool(**kwargs)
+    return _default_pool
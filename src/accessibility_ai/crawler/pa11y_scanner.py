@@ -0,0 +1,434 @@
+"""
+Pa11y-based URL scanner.
+
+Wraps the pa11y CLI (Node.js) to scan single URLs or whole sitemaps and
+returns Pa11y-style issue dicts that feed into parse_pa11y_report.
+Requires `pa11y` to be installed and on PATH (`npm install -g pa11y`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson when installed: parses bytes directly (no intermediate str)
+# and is several times faster than stdlib json on large reports.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Pa11y exits 2 when it finds issues; only other non-zero codes are errors.
+_PA11Y_OK_CODES = (0, 2)
+
+DEFAULT_RUNNER = "axe"
+DEFAULT_STANDARD = "WCAG2AA"
+SCAN_TIMEOUT_S = 60
+
+# Stream-reader chunk size and asyncio pipe buffer limit for subprocess IO.
+_READ_CHUNK = 1 << 16
+_PIPE_LIMIT = 1 << 22
+
+
+async def _read_stdout_chunks(stream: asyncio.StreamReader) -> bytes:
+    """Drain a pipe in chunks rather than one monolithic read."""
+    chunks: List[bytes] = []
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _read_stderr_tail(stream: asyncio.StreamReader, keep: int = 4096) -> bytes:
+    """Drain stderr but retain only the tail, for error reporting."""
+    tail = b""
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        tail = (tail + chunk)[-keep:]
+    return tail
+
+
+@lru_cache(maxsize=2)
+def check_pa11y_installed(verify: bool = False) -> bool:
+    """
+    Check whether the pa11y CLI is available.
+
+    The default path is a PATH lookup via shutil.which — no Node.js process
+    is spawned — and the result is memoized. Pass verify=True to do a real
+    `pa11y --version` handshake (slow: pays Node startup).
+    """
+    if shutil.which("pa11y") is None:
+        return False
+    if not verify:
+        return True
+    try:
+        result = subprocess.run(
+            ["pa11y", "--version"], capture_output=True, timeout=30
+        )
+        return result.returncode == 0
+    except Exception as e:
+        logger.warning("pa11y version check failed: %s", e)
+        return False
+
+
+_SIDECAR_PATH = Path(__file__).parent / "pa11y_sidecar.js"
+
+
+class _Pa11ySidecar:
+    """
+    Persistent Node process that keeps one Chromium alive and serves pa11y
+    scans over stdin/stdout JSON lines, avoiding the ~1-2s Node + browser
+    cold start that the CLI pays per URL.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._pending: Dict[int, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._next_id = 0
+        self._reader_task: Optional["asyncio.Task[None]"] = None
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def start(self) -> None:
+        self._proc = await asyncio.create_subprocess_exec(
+            "node", str(_SIDECAR_PATH),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Wait for the ready handshake so startup failures surface here.
+        assert self._proc.stdout is not None
+        line = await asyncio.wait_for(self._proc.stdout.readline(), timeout=30)
+        if not line or not json.loads(line).get("ready"):
+            raise RuntimeError("pa11y sidecar failed to start")
+        self._reader_task = asyncio.create_task(self._read_loop())
+        logger.info("pa11y sidecar started (pid %s)", self._proc.pid)
+
+    async def _read_loop(self) -> None:
+        assert self._proc is not None and self._proc.stdout is not None
+        while True:
+            line = await self._proc.stdout.readline()
+            if not line:
+                break
+            try:
+                msg = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            fut = self._pending.pop(msg.get("id"), None)
+            if fut is not None and not fut.done():
+                fut.set_result(msg)
+        # Sidecar died: fail anything still in flight.
+        for fut in self._pending.values():
+            if not fut.done():
+                fut.set_exception(RuntimeError("pa11y sidecar exited"))
+        self._pending.clear()
+
+    async def scan(self, url: str, runner: str, standard: str) -> Dict[str, Any]:
+        assert self._proc is not None and self._proc.stdin is not None
+        self._next_id += 1
+        req_id = self._next_id
+        fut: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = fut
+        request = json.dumps(
+            {"id": req_id, "url": url, "runner": runner, "standard": standard}
+        )
+        async with self._write_lock:
+            self._proc.stdin.write(request.encode() + b"\n")
+            await self._proc.stdin.drain()
+        try:
+            return await asyncio.wait_for(fut, timeout=SCAN_TIMEOUT_S)
+        finally:
+            self._pending.pop(req_id, None)
+
+    async def stop(self) -> None:
+        if self._proc is not None and self._proc.stdin is not None:
+            try:
+                self._proc.stdin.close()
+                await asyncio.wait_for(self._proc.wait(), timeout=10)
+            except Exception:
+                self._proc.kill()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        self._proc = None
+
+
+_sidecar: Optional[_Pa11ySidecar] = None
+_sidecar_disabled = False
+
+
+async def _get_sidecar() -> Optional[_Pa11ySidecar]:
+    """Return the shared sidecar, starting it on first use; None if unusable."""
+    global _sidecar, _sidecar_disabled
+    if _sidecar_disabled:
+        return None
+    if _sidecar is not None and _sidecar.running:
+        return _sidecar
+    if shutil.which("node") is None:
+        _sidecar_disabled = True
+        return None
+    sidecar = _Pa11ySidecar()
+    try:
+        await sidecar.start()
+    except Exception as e:
+        # Most likely pa11y/puppeteer not resolvable for Node; fall back to
+        # the CLI path for the rest of the process.
+        logger.info("pa11y sidecar unavailable, using CLI per URL: %s", e)
+        _sidecar_disabled = True
+        return None
+    _sidecar = sidecar
+    return sidecar
+
+
+async def scan_url_with_pa11y(
+    url: str,
+    runner: str = DEFAULT_RUNNER,
+    standard: str = DEFAULT_STANDARD,
+) -> Dict[str, Any]:
+    """
+    Scan a single URL with pa11y and return {"url", "issues"}.
+
+    Issues use Pa11y's JSON reporter shape (code/message/type/selector).
+    Uses the persistent Node sidecar when available so each scan is a
+    message send instead of a full Node + Chromium startup.
+    """
+    sidecar = await _get_sidecar()
+    if sidecar is not None:
+        try:
+            msg = await sidecar.scan(url, runner, standard)
+            if msg.get("error"):
+                logger.warning("pa11y sidecar scan of %s failed: %s", url, msg["error"])
+                return {"url": url, "issues": [], "error": "pa11y_failed"}
+            issues = msg.get("issues")
+            return {"url": url, "issues": issues if isinstance(issues, list) else []}
+        except Exception as e:
+            logger.warning("pa11y sidecar request for %s failed: %s", url, e)
+            # Fall through to the CLI path below.
+
+    cmd = [
+        "pa11y",
+        "--reporter", "json",
+        "--runner", runner,
+        "--standard", standard,
+        url,
+    ]
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_PIPE_LIMIT,
+        )
+    except FileNotFoundError:
+        logger.warning("pa11y CLI not found on PATH; install with `npm install -g pa11y`")
+        return {"url": url, "issues": [], "error": "pa11y_not_installed"}
+    try:
+        # Chunked readers instead of communicate(): stderr is capped to a
+        # tail, so a large report only ever costs one stdout buffer.
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout, stderr = await asyncio.wait_for(
+            asyncio.gather(
+                _read_stdout_chunks(proc.stdout),
+                _read_stderr_tail(proc.stderr),
+            ),
+            timeout=SCAN_TIMEOUT_S,
+        )
+        await proc.wait()
+    except asyncio.TimeoutError:
+        proc.kill()
+        logger.warning("pa11y scan of %s timed out after %ds", url, SCAN_TIMEOUT_S)
+        return {"url": url, "issues": [], "error": "timeout"}
+
+    if proc.returncode not in _PA11Y_OK_CODES:
+        logger.warning(
+            "pa11y scan of %s failed (exit %s): %s",
+            url,
+            proc.returncode,
+            stderr.decode(errors="replace")[:500],
+        )
+        return {"url": url, "issues": [], "error": "pa11y_failed"}
+
+    try:
+        issues = _loads(stdout)
+    except (_JSONDecodeError, UnicodeDecodeError) as e:
+        logger.warning("Could not parse pa11y output for %s: %s", url, e)
+        return {"url": url, "issues": [], "error": "bad_output"}
+
+    if not isinstance(issues, list):
+        issues = []
+    return {"url": url, "issues": issues}
+
+
+# Batch through pa11y-ci (one Node process for all URLs) once a scan is
+# big enough for the per-URL startup cost to dominate.
+_PA11Y_CI_MIN_URLS = 5
+
+
+async def _scan_with_pa11y_ci(
+    urls: List[str],
+    max_concurrent: int = 4,
+    runner: str = DEFAULT_RUNNER,
+    standard: str = DEFAULT_STANDARD,
+) -> Dict[str, Any]:
+    """Scan all URLs through a single pa11y-ci subprocess."""
+    config = {
+        "urls": urls,
+        "defaults": {
+            "runners": [runner],
+            "standard": standard,
+            "concurrency": max_concurrent,
+        },
+    }
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".json", delete=False, encoding="utf-8"
+    ) as f:
+        json.dump(config, f)
+        config_path = f.name
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "pa11y-ci", "--json", "--config", config_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=SCAN_TIMEOUT_S * max(1, len(urls))
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            logger.warning("pa11y-ci batch scan of %d urls timed out", len(urls))
+            return {"issues": [], "urls_scanned": len(urls), "error": "timeout"}
+
+        try:
+            report = _loads(stdout)
+        except (_JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning("Could not parse pa11y-ci output: %s", e)
+            return {"issues": [], "urls_scanned": len(urls), "error": "bad_output"}
+
+        all_issues: List[Dict[str, Any]] = []
+        for url_issues in (report.get("results") or {}).values():
+            if isinstance(url_issues, list):
+                all_issues.extend(url_issues)
+        return {"issues": all_issues, "urls_scanned": len(urls)}
+    finally:
+        try:
+            os.unlink(config_path)
+        except OSError:
+            pass
+
+
+async def scan_sitemap_with_pa11y(
+    urls: List[str],
+    max_concurrent: int = 4,
+    runner: str = DEFAULT_RUNNER,
+    standard: str = DEFAULT_STANDARD,
+) -> Dict[str, Any]:
+    """
+    Scan many URLs concurrently (bounded by max_concurrent) and merge the
+    per-URL issues into one Pa11y-style report dict.
+
+    Large scans are routed through pa11y-ci when it is installed, which
+    amortizes the Node/Chromium startup across all URLs in one process.
+    """
+    if len(urls) > _PA11Y_CI_MIN_URLS and shutil.which("pa11y-ci"):
+        return await _scan_with_pa11y_ci(
+            urls, max_concurrent=max_concurrent, runner=runner, standard=standard
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def scan_with_semaphore(u: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await scan_url_with_pa11y(u, runner=runner, standard=standard)
+
+    tasks = [asyncio.create_task(scan_with_semaphore(u)) for u in urls]
+
+    # Aggregate as scans finish rather than holding every per-URL result
+    # until the slowest one completes.
+    all_issues: List[Dict[str, Any]] = []
+    done = 0
+    for fut in asyncio.as_completed(tasks):
+        res = await fut
+        all_issues.extend(res.get("issues", []))
+        done += 1
+        logger.debug("pa11y sitemap scan progress: %d/%d", done, len(urls))
+    return {"issues": all_issues, "urls_scanned": len(urls)}
+
+
+# Shared event loop for the sync wrappers, run forever on a background
+# thread. asyncio.run builds and tears down a loop (selector, thread pool
+# and all) per call, which dominates the cost of small scans in batch
+# callers; one persistent loop pays that setup once per process. It also
+# keeps the pa11y sidecar usable across calls, since its futures are
+# bound to one loop. (A thread rather than asyncio.Runner because Runner
+# only exists on 3.11+ and pyproject declares >=3.10.)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _shutdown_loop() -> None:
+    if _loop is not None and not _loop.is_closed():
+        _loop.call_soon_threadsafe(_loop.stop)
+        if _loop_thread is not None:
+            _loop_thread.join(timeout=5)
+        _loop.close()
+
+
+def _run(coro: "Coroutine[Any, Any, Dict[str, Any]]") -> Dict[str, Any]:
+    """Run a coroutine on the shared loop, starting it on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="pa11y-loop", daemon=True
+            )
+            _loop_thread.start()
+            atexit.register(_shutdown_loop)
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+def scan_url_sync(
+    url: str,
+    runner: str = DEFAULT_RUNNER,
+    standard: str = DEFAULT_STANDARD,
+) -> Dict[str, Any]:
+    """Synchronous wrapper around scan_url_with_pa11y."""
+    return _run(scan_url_with_pa11y(url, runner=runner, standard=standard))
+
+
+def scan_multiple_urls_sync(
+    urls: List[str],
+    max_concurrent: int = 4,
+    runner: str = DEFAULT_RUNNER,
+    standard: str = DEFAULT_STANDARD,
+) -> Dict[str, Any]:
+    """Synchronous wrapper around scan_sitemap_with_pa11y."""
+    return _run(
+        scan_sitemap_with_pa11y(
+            urls, max_concurrent=max_concurrent, runner=runner, standard=standard
+        )
+    )
@@ -0,0 +1,44 @@
+#!/usr/bin/env node
+// Long-lived pa11y runner used by pa11y_scanner.py.
+//
+// Keeps one shared Chromium alive and serves scan requests over
+// stdin/stdout as newline-delimited JSON:
+//   request:  {"id": 1, "url": "...", "runner": "axe", "standard": "WCAG2AA"}
+//   response: {"id": 1, "issues": [...]} or {"id": 1, "issues": [], "error": "..."}
+//
+// Requires `pa11y` and `puppeteer` to be resolvable (npm install -g pa11y).
+
+const readline = require('readline');
+const pa11y = require('pa11y');
+const puppeteer = require('puppeteer');
+
+(async () => {
+  const browser = await puppeteer.launch({ headless: 'new' });
+  process.stdout.write(JSON.stringify({ ready: true }) + '\n');
+
+  const rl = readline.createInterface({ input: process.stdin });
+  rl.on('line', async (line) => {
+    let req;
+    try {
+      req = JSON.parse(line);
+    } catch (e) {
+      return;
+    }
+    const { id, url, runner, standard } = req;
+    try {
+      const res = await pa11y(url, {
+        browser,
+        runners: [runner || 'axe'],
+        standard: standard || 'WCAG2AA',
+      });
+      process.stdout.write(JSON.stringify({ id, issues: res.issues || [] }) + '\n');
+    } catch (e) {
+      process.stdout.write(JSON.stringify({ id, issues: [], error: String(e) }) + '\n');
+    }
+  });
+
+  rl.on('close', async () => {
+    await browser.close();
+    process.exit(0);
+  });
+})();
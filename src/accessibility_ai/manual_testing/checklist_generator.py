@@ -3,7 +3,9 @@ Checklist generator for manual accessibility testing.
 Combines page-type and component checklists into a complete testing plan.
 """
 
-from typing import List, Dict, Any
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from .templates import (
     get_page_type_checklist,
     get_component_checklist,
@@ -11,6 +13,25 @@ from .templates import (
     get_all_components
 )
 
+# Precompiled (rule_id pattern, selector pattern) per component, each
+# matched only against the field its keywords came from — e.g. "tab" is a
+# rule-id signal while "#main-table" selectors must not trip "tabs", and
+# bare "title"/"date"/"select" only count in their original field. One or
+# two C-level regex scans per component replace ~20 Python substring
+# checks per issue.
+_COMPONENT_PATTERNS: Dict[str, Tuple["re.Pattern[str]", Optional["re.Pattern[str]"]]] = {
+    "modal": (re.compile(r'dialog|modal'), re.compile(r'role="dialog"')),
+    "dropdown": (re.compile(r'dropdown'), re.compile(r'select|combobox')),
+    "tabs": (re.compile(r'tab'), re.compile(r'tablist|role="tab"')),
+    "carousel": (re.compile(r'carousel|slider'), re.compile(r'slide')),
+    "accordion": (re.compile(r'accordion'), re.compile(r'aria-expanded')),
+    "datepicker": (re.compile(r'date'), re.compile(r'datepicker|calendar')),
+    "menu": (re.compile(r'menu|navigation'), re.compile(r'nav')),
+    "search": (re.compile(r'search'), re.compile(r'search')),
+    "pagination": (re.compile(r'pagination'), re.compile(r'pager')),
+    "tooltip": (re.compile(r'tooltip|title'), None),
+}
+
 
 def generate_checklist(page_type: str, components: List[str]) -> Dict[str, Any]:
     """
@@ -21,31 +42,38 @@ def generate_checklist(page_type: str, components: List[str]) -> Dict[str, Any]:
         components: List of component names present on the page
     
     Returns:
-        Dictionary containing checklist metadata and items
+        Dictionary containing checklist metadata and items. Results are
+        cached per (page_type, components) and shared - treat as read-only.
     """
-    # Start with page-type specific checklist
-    checklist_items = get_page_type_checklist(page_type)
-    
+    return _generate_cached(page_type, tuple(components))
+
+
+@lru_cache(maxsize=128)
+def _generate_cached(page_type: str, components: tuple) -> Dict[str, Any]:
+    # Start with page-type specific checklist (getters return cached
+    # tuples, so copy into a list before extending)
+    checklist_items = list(get_page_type_checklist(page_type))
+
     # Add component-specific items
-    for component in components:
-        component_items = get_component_checklist(component)
-        checklist_items.extend(component_items)
-    
-    # Build summary statistics
-    categories = set(item["category"] for item in checklist_items)
-    priority_counts = {
-        "critical": len([item for item in checklist_items if item["priority"] == "critical"]),
-        "high": len([item for item in checklist_items if item["priority"] == "high"]),
-        "medium": len([item for item in checklist_items if item["priority"] == "medium"]),
-        "low": len([item for item in checklist_items if item["priority"] == "low"])
-    }
+    checklist_items.extend(
+        item for component in components for item in get_component_checklist(component)
+    )
     
+    # Build summary statistics in a single pass
+    categories = set()
+    priority_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    for item in checklist_items:
+        categories.add(item["category"])
+        priority = item["priority"]
+        if priority in priority_counts:
+            priority_counts[priority] += 1
+
     # Estimate testing time (rough estimate: 2 min per item)
     estimated_minutes = len(checklist_items) * 2
     
     return {
         "page_type": page_type,
-        "components": components,
+        "components": list(components),
         "total_items": len(checklist_items),
         "categories": sorted(list(categories)),
         "priority_counts": priority_counts,
@@ -76,49 +104,16 @@ def detect_components_from_report(issues: List[Dict[str, Any]]) -> List[str]:
         List of detected component names
     """
     detected = set()
-    
+
     for issue in issues:
         rule_id = issue.get("rule_id", "").lower()
         selector = issue.get("selector", "").lower()
-        
-        # Modal detection
-        if "dialog" in rule_id or "modal" in rule_id or "role=\"dialog\"" in selector:
-            detected.add("modal")
-        
-        # Dropdown detection
-        if "select" in selector or "dropdown" in rule_id or "combobox" in selector:
-            detected.add("dropdown")
-        
-        # Tabs detection
-        if "tab" in rule_id or "tablist" in selector or "role=\"tab\"" in selector:
-            detected.add("tabs")
-        
-        # Carousel detection
-        if "carousel" in rule_id or "slider" in rule_id or "slide" in selector:
-            detected.add("carousel")
-        
-        # Accordion detection
-        if "accordion" in rule_id or "aria-expanded" in selector:
-            detected.add("accordion")
-        
-        # Date picker detection
-        if "date" in rule_id or "datepicker" in selector or "calendar" in selector:
-            detected.add("datepicker")
-        
-        # Menu detection
-        if "menu" in rule_id or "navigation" in rule_id or "nav" in selector:
-            detected.add("menu")
-        
-        # Search detection
-        if "search" in rule_id or "search" in selector:
-            detected.add("search")
-        
-        # Pagination detection
-        if "pagination" in rule_id or "pager" in selector:
-            detected.add("pagination")
-        
-        # Tooltip detection
-        if "tooltip" in rule_id or "title" in rule_id:
-            detected.add("tooltip")
-    
-    return sorted(list(detected))
+        for name, (rule_pat, sel_pat) in _COMPONENT_PATTERNS.items():
+            if name in detected:
+                continue
+            if rule_pat.search(rule_id) or (sel_pat is not None and sel_pat.search(selector)):
+                detected.add(name)
+        if len(detected) == len(_COMPONENT_PATTERNS):
+            break
+
+    return sorted(detected)
@@ -0,0 +1,357 @@
+"""
+Hardcoded manual testing checklist templates based on professional accessibility testing standards.
+No AI needed - these are established testing methodologies from WCAG and professional testers.
+
+Each test item follows the structure:
+- test_item: Specific action to perform (verb-first, clear instruction)
+- how_to_test: Exact steps with keyboard shortcuts and tools
+- what_to_look_for: Clear pass/fail criteria
+- wcag_reference: Specific WCAG guideline
+- priority: high/medium/low (impact-based)
+- estimated_time: Realistic time estimate in minutes
+"""
+
+import importlib
+import json
+import marshal
+import mmap
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+try:  # optional fast parser, same fallback shape as the pa11y scanner
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+class ChecklistItemDict(TypedDict):
+    """Shape of one checklist item as stored in templates_data/."""
+
+    id: str
+    category: str
+    test_item: str
+    how_to_test: str
+    what_to_look_for: str
+    wcag_reference: str
+    priority: str
+    estimated_time: int
+
+
+# Raw checklist data lives in data/, one JSON file per
+# checklist, so touching one template parses only its own file — the
+# PEP 562 hook below loads nothing until a template is first accessed,
+# and a caller that only needs e.g. the component map never parses the
+# page checklists at all.
+_DATA_DIR = Path(__file__).parent / "data"
+
+_PAGE_FILES = {
+    "BASE_CHECKLIST": "base.json",
+    "USER_ACCOUNT_CHECKLIST": "user_account.json",
+    "SEARCH_RESULTS_CHECKLIST": "search_results.json",
+    "CONTENT_ARTICLES_CHECKLIST": "content_articles.json",
+    "FORMS_DATA_INPUT_CHECKLIST": "forms_data_input.json",
+    "DASHBOARD_CHECKLIST": "dashboard.json",
+    "ECOMMERCE_CHECKLIST": "ecommerce.json",
+    "ECOMMERCE_CHECKOUT_CHECKLIST": "ecommerce_checkout.json",
+    "MARKETING_LANDING_CHECKLIST": "marketing_landing.json",
+}
+
+
+class _StrPool(Dict[str, str]):
+    """
+    Process-wide string pool: many values recur verbatim across checklist
+    items (WCAG references, priorities, whole bullet lines), and json.load
+    allocates a fresh str per occurrence. Indexing the pool with a string
+    returns its canonical copy, storing it on first sight, so every loader
+    path shares one object per distinct value and downstream equality
+    checks compare by pointer. Swapping canonical values (e.g. for enums)
+    later only needs to touch __missing__.
+    """
+
+    def __missing__(self, key: str) -> str:
+        # sys.intern only wins for identifier-like strings; the pool dict
+        # itself handles the long prose.
+        value = sys.intern(key) if len(key) < 64 else key
+        self[key] = value
+        return value
+
+
+_POOL = _StrPool()
+
+
+def _intern(value: str) -> str:
+    return _POOL[value]
+
+
+def _pooled_object(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """json object_pairs_hook: pool keys and string values as they parse,
+    so no throwaway unpooled dicts are built first."""
+    return {
+        _intern(k): _intern(v) if isinstance(v, str) else v for k, v in pairs
+    }
+
+
+def _pool_tree(obj: Any) -> Any:
+    """Route every string in a loaded tree through the pool (used for
+    data that bypassed the json hook, e.g. the marshal cache)."""
+    if isinstance(obj, str):
+        return _intern(obj)
+    if isinstance(obj, list):
+        return [_pool_tree(v) for v in obj]
+    if isinstance(obj, dict):
+        return {_intern(k): _pool_tree(v) for k, v in obj.items()}
+    return obj
+
+
+# Bump when the data layout changes so stale caches self-invalidate.
+_MARSHAL_VERSION = 1
+
+
+@lru_cache(maxsize=16)
+def _load_file(filename: str) -> Any:
+    """
+    Load one data file, preferring a .marshal byte cache next to the
+    JSON: marshal.load rebuilds the tree in C at disk-read speed,
+    skipping JSON tokenization. The cache is written best-effort after
+    the first JSON parse and ignored whenever the JSON is newer.
+    """
+    src = _DATA_DIR / filename
+    cache = src.with_suffix(".marshal")
+    try:
+        if cache.stat().st_mtime > src.stat().st_mtime:
+            # mmap the cache so multi-worker deployments share the file
+            # bytes through the page cache instead of each reading a
+            # private copy. (Full zero-copy of the deserialized objects
+            # would need a flat binary format like FlatBuffers; at tens
+            # of KB of template data the Python-object heap cost per
+            # worker does not justify that machinery.)
+            with open(cache, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    version, data = marshal.loads(buf)
+            if version == _MARSHAL_VERSION:
+                return _pool_tree(data)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    if orjson is not None:
+        # orjson has no object_pairs_hook, so pool the finished tree; its
+        # C parser still wins over json even with the extra walk.
+        data = _pool_tree(orjson.loads(src.read_bytes()))
+    else:
+        with open(src, "r", encoding="utf-8") as f:
+            data = json.load(f, object_pairs_hook=_pooled_object)
+    try:
+        with open(cache, "wb") as f:
+            marshal.dump((_MARSHAL_VERSION, data), f)
+    except OSError:
+        # Read-only installs simply re-parse the JSON each process.
+        pass
+    return data
+
+
+def _freeze_items(raw: List[ChecklistItemDict]) -> Tuple[ChecklistItemDict, ...]:
+    """Freeze a loaded (already pooled) item list into a shared tuple."""
+    return tuple(raw)
+
+
+# Names served by the table submodule; importing it compiles the
+# columnar/rendering machinery, so defer that until one of these is
+# actually touched.
+_TABLE_EXPORTS = frozenset({
+    "ChecklistItem",
+    "ChecklistTable",
+    "PriorityLevel",
+    "WCAGRef",
+    "parse_wcag_reference",
+    "split_steps",
+    "split_criteria_lines",
+    "parse_criteria",
+    "render_item_html",
+    "get_stats",
+    "get_page_type_table",
+    "get_page_type_items",
+    "get_component_table",
+    "get_component_items",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _TABLE_EXPORTS:
+        value = getattr(importlib.import_module(".table", __name__), name)
+        globals()[name] = value
+        return value
+    if name == "COMPONENT_CHECKLISTS":
+        # Read-only view: the tuples freeze each component's items and the
+        # proxy stops callers from adding or replacing components.
+        value: Any = MappingProxyType(
+            {k: _freeze_items(v) for k, v in _load_file("components.json").items()}
+        )
+    elif name in _PAGE_FILES:
+        value = _freeze_items(_load_file(_PAGE_FILES[name]))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def _template(name: str) -> Any:
+    """Fetch a lazily built template, building and caching it if needed."""
+    value = globals().get(name)
+    if value is None:
+        value = __getattr__(name)
+    return value
+
+
+# Page type -> template attribute, covering legacy aliases and the newer
+# professional category names.
+_PAGE_TYPE_ATTR = {
+    "form": "FORMS_DATA_INPUT_CHECKLIST",
+    "forms_data_input": "FORMS_DATA_INPUT_CHECKLIST",
+    "dashboard": "DASHBOARD_CHECKLIST",
+    "data_display": "DASHBOARD_CHECKLIST",
+    "ecommerce": "ECOMMERCE_CHECKLIST",
+    "ecommerce_product": "ECOMMERCE_CHECKLIST",
+    "landing": "MARKETING_LANDING_CHECKLIST",
+    "marketing": "MARKETING_LANDING_CHECKLIST",
+    "ecommerce_checkout": "ECOMMERCE_CHECKOUT_CHECKLIST",
+    "user_account": "USER_ACCOUNT_CHECKLIST",
+    "search_results": "SEARCH_RESULTS_CHECKLIST",
+    "content_articles": "CONTENT_ARTICLES_CHECKLIST",
+}
+
+
+@lru_cache(maxsize=64)
+def get_page_type_checklist(page_type: str) -> Tuple[ChecklistItemDict, ...]:
+    """
+    Get the checklist for a specific page type.
+    
+    Args:
+        page_type: Type of page - supports both legacy and new naming:
+            Legacy: landing, form, dashboard, ecommerce
+            New: marketing, forms_data_input, data_display, ecommerce_product, 
+                 ecommerce_checkout, user_account, search_results, content_articles
+    
+    Returns:
+        Tuple of checklist items combining base + page-specific items.
+        Cached and shared between callers - treat items as read-only.
+    """
+    base: Tuple[Dict[str, Any], ...] = _template("BASE_CHECKLIST")
+    attr = _PAGE_TYPE_ATTR.get(page_type)
+    if attr is None:
+        return base
+    return base + _template(attr)
+
+
+@lru_cache(maxsize=64)
+def get_component_checklist(component: str) -> Tuple[ChecklistItemDict, ...]:
+    """
+    Get checklist items for a specific component.
+    
+    Args:
+        component: Component name (modal, dropdown, tabs, etc.)
+    
+    Returns:
+        Tuple of component-specific checklist items.
+        Cached and shared between callers - treat items as read-only.
+    """
+    return _template("COMPONENT_CHECKLISTS").get(component, ())
+
+
+@lru_cache(maxsize=1)
+def _component_layout() -> Tuple[Tuple[ChecklistItemDict, ...], Dict[str, range]]:
+    """Flatten the component map into one tuple plus per-component ranges,
+    so whole-catalog passes iterate a single tuple instead of a dict of
+    tuples, while per-component access stays an O(1) slice."""
+    items: List[ChecklistItemDict] = []
+    ranges: Dict[str, range] = {}
+    for name, component_items in _template("COMPONENT_CHECKLISTS").items():
+        start = len(items)
+        items.extend(component_items)
+        ranges[name] = range(start, len(items))
+    return tuple(items), ranges
+
+
+def get_all_component_items() -> Tuple[ChecklistItemDict, ...]:
+    """Every component checklist item in one flat tuple."""
+    return _component_layout()[0]
+
+
+def get_component_range(component: str) -> range:
+    """The flat-tuple slice holding one component's items."""
+    return _component_layout()[1].get(component, range(0))
+
+
+@lru_cache(maxsize=1)
+def _id_index() -> Dict[str, ChecklistItemDict]:
+    """All items across every page and component checklist, keyed by id.
+    Built on first lookup; ids are unique across the template data."""
+    index: Dict[str, ChecklistItemDict] = {}
+    for attr in _PAGE_FILES:
+        for item in _template(attr):
+            index[item["id"]] = item
+    for items in _template("COMPONENT_CHECKLISTS").values():
+        for item in items:
+            index[item["id"]] = item
+    return index
+
+
+def get_item_by_id(item_id: str) -> Optional[ChecklistItemDict]:
+    """Look up any checklist item by id in O(1), e.g. "kb-001"."""
+    return _id_index().get(item_id)
+
+
+# Supported page types and their display names, built once at import.
+# The getters below hand out copies so callers can keep mutating freely.
+_ALL_PAGE_TYPES: Tuple[str, ...] = (
+    # Legacy types (for backward compatibility)
+    "landing", "form", "dashboard", "ecommerce",
+    # New professional categories
+    "marketing", "forms_data_input", "data_display",
+    "ecommerce_product", "ecommerce_checkout",
+    "user_account", "search_results", "content_articles",
+)
+
+_PAGE_TYPE_DISPLAY_NAMES: Dict[str, str] = {
+    # Legacy types
+    "landing": "Landing Page",
+    "form": "Form Page",
+    "dashboard": "Dashboard",
+    "ecommerce": "E-commerce",
+    # New professional categories
+    "marketing": "Marketing/Landing Pages",
+    "forms_data_input": "Forms & Data Input",
+    "data_display": "Data Display & Dashboards",
+    "ecommerce_product": "E-commerce: Product Pages",
+    "ecommerce_checkout": "E-commerce: Checkout Flow",
+    "user_account": "User Account & Profile",
+    "search_results": "Search & Results",
+    "content_articles": "Content & Articles",
+}
+
+
+def get_all_page_types() -> List[str]:
+    """
+    Get list of all supported page types.
+    Returns both legacy and new page type identifiers.
+    """
+    return list(_ALL_PAGE_TYPES)
+
+
+def get_page_type_display_names() -> Dict[str, str]:
+    """
+    Get mapping of page type IDs to display names for UI.
+    """
+    return dict(_PAGE_TYPE_DISPLAY_NAMES)
+
+
+@lru_cache(maxsize=1)
+def _component_names() -> Tuple[str, ...]:
+    return tuple(_template("COMPONENT_CHECKLISTS"))
+
+
+def get_all_components() -> List[str]:
+    """Get list of all supported component types."""
+    return list(_component_names())
+
+
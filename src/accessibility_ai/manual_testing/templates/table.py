@@ -0,0 +1,411 @@
+"""
+Columnar, record and rendering views over the checklist templates.
+
+Everything here derives from the dict-shaped template data in the parent
+package; it is imported lazily via the package __getattr__ so callers
+that only serve the raw checklists never compile this module.
+"""
+
+import array
+import html
+import re
+import sys
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from . import (
+    ChecklistItemDict,
+    _id_index,
+    _intern,
+    get_component_checklist,
+    get_page_type_checklist,
+)
+
+_P_HIGH = sys.intern("high")
+_P_MEDIUM = sys.intern("medium")
+_P_LOW = sys.intern("low")
+
+
+class PriorityLevel(IntEnum):
+    """Checklist priority as an ordered integer for branch-free compares."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+
+_PRIORITY_LEVELS: Dict[str, PriorityLevel] = {
+    _P_LOW: PriorityLevel.LOW,
+    _P_MEDIUM: PriorityLevel.MEDIUM,
+    _P_HIGH: PriorityLevel.HIGH,
+}
+_LEVEL_NAMES = (_P_LOW, _P_MEDIUM, _P_HIGH)
+
+
+class WCAGRef(NamedTuple):
+    """Parsed WCAG reference: ("2.1.1", "Keyboard", "A")."""
+
+    code: str
+    title: str
+    level: str
+
+    def __str__(self) -> str:
+        return f"{self.code} {self.title} (Level {self.level})"
+
+
+_WCAG_REF_RE = re.compile(r"^([\d.]+)\s+(.*?)\s*\(Level\s+(A+)\)$")
+
+
+@lru_cache(maxsize=128)
+def parse_wcag_reference(reference: str) -> WCAGRef:
+    """
+    Parse a display reference like "2.1.1 Keyboard (Level A)" into a
+    shared WCAGRef record, so consumers can compare or group by code and
+    level without slicing strings per item. Falls back to the whole
+    string as title for refs that do not match the usual shape.
+    """
+    m = _WCAG_REF_RE.match(reference)
+    if m is None:
+        return WCAGRef("", sys.intern(reference), "")
+    return WCAGRef(sys.intern(m.group(1)), sys.intern(m.group(2)), sys.intern(m.group(3)))
+
+
+@lru_cache(maxsize=512)
+def split_steps(how_to_test: str) -> Tuple[str, ...]:
+    """
+    Split a numbered how_to_test blob into its step lines, once per
+    distinct blob. Lines are routed through the string pool, so steps
+    repeated across items ("1. Start NVDA", "1. Press Tab", ...) share
+    one str object and renderers stop re-splitting per request.
+    """
+    return tuple(
+        _intern(stripped)
+        for line in how_to_test.split("\n")
+        if (stripped := line.strip())
+    )
+
+
+@lru_cache(maxsize=512)
+def split_criteria_lines(what_to_look_for: str) -> Tuple[str, ...]:
+    """
+    A what_to_look_for blob as its raw bullet lines (markers kept),
+    split once per distinct blob with the lines pooled. Renderers that
+    show the bullets verbatim iterate this instead of calling
+    str.split per request; parse_criteria strips the markers for those
+    that style pass/fail separately.
+    """
+    return tuple(
+        _intern(stripped)
+        for line in what_to_look_for.split("\n")
+        if (stripped := line.strip())
+    )
+
+
+@lru_cache(maxsize=512)
+def parse_criteria(what_to_look_for: str) -> Tuple[Tuple[Optional[bool], str], ...]:
+    """
+    Split a what_to_look_for blob into structured (is_pass, text) pairs.
+
+    Lines prefixed "\u2713" are pass criteria (True), "\u2717" fail
+    criteria (False); unmarked lines carry None so consumers can style
+    them neutrally. The 3-byte markers are dropped from storage and the
+    texts pooled, so the flag costs one shared singleton per line.
+    Parsed once per distinct blob.
+    """
+    criteria: List[Tuple[Optional[bool], str]] = []
+    for line in what_to_look_for.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("\u2713"):
+            criteria.append((True, _intern(line[1:].strip())))
+        elif line.startswith("\u2717"):
+            criteria.append((False, _intern(line[1:].strip())))
+        else:
+            criteria.append((None, _intern(line)))
+    return tuple(criteria)
+
+
+class ChecklistItem(NamedTuple):
+    """
+    Compact per-item record: a plain tuple under the hood (~3x smaller
+    than the 8-key dict form), with C-level attribute access. Use
+    _asdict() at boundaries that still expect the dict shape.
+    """
+
+    id: str
+    category: str
+    test_item: str
+    how_to_test: str
+    what_to_look_for: str
+    wcag_reference: str
+    priority: str
+    estimated_time: int
+
+
+@dataclass(frozen=True, slots=True)
+class ChecklistTable:
+    """
+    Columnar (struct-of-arrays) view over a checklist.
+
+    Filter and aggregate passes touch one contiguous tuple of small
+    interned strings per column instead of probing a dict per item, and
+    the column tuples are shared with the template data, not copied.
+    """
+
+    ids: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    test_items: Tuple[str, ...]
+    # how_to_test / what_to_look_for are the bulkiest fields (200-400
+    # bytes of highly redundant prose each) and are only read when an
+    # item is actually rendered, so they are held zlib-compressed and
+    # inflated on demand. prose_dict is a shared zlib preset dictionary
+    # built from the column text itself, letting each small blob borrow
+    # cross-item redundancy ("Press Tab", "NVDA announces", ...) that
+    # per-item compression cannot see.
+    how_to_test_blobs: Tuple[bytes, ...]
+    what_to_look_for_blobs: Tuple[bytes, ...]
+    prose_dict: bytes
+    wcag_references: Tuple[str, ...]
+    # PriorityLevel values, one byte per row; compares are integer CMPs
+    # instead of string hashing, and "priority >= MEDIUM" style scans
+    # need no branching on names.
+    priorities: "array.array[int]"
+    # Unsigned bytes, not boxed ints: estimates are 1-5 minutes, and sums
+    # over the column run at C speed over contiguous storage.
+    estimated_times: "array.array[int]"
+    # Row-index lookups built once at construction; the data is static,
+    # so filters are a dict probe instead of an O(N) column scan.
+    by_category: Dict[str, Tuple[int, ...]]
+    by_priority: Dict[str, Tuple[int, ...]]
+    by_wcag: Dict[str, Tuple[int, ...]]
+
+    @classmethod
+    def from_items(cls, items: Tuple[ChecklistItemDict, ...]) -> "ChecklistTable":
+        """Build a table from checklist item dicts."""
+        prose = [i["how_to_test"] for i in items]
+        prose += [i["what_to_look_for"] for i in items]
+        # zlib accepts at most a 32KB preset dictionary; keep the tail,
+        # matches are found anywhere in it.
+        prose_dict = "\n".join(prose).encode("utf-8")[-32768:]
+
+        def compress(text: str) -> bytes:
+            c = zlib.compressobj(9, zdict=prose_dict)
+            return c.compress(text.encode("utf-8")) + c.flush()
+
+        by_category: Dict[str, List[int]] = defaultdict(list)
+        by_priority: Dict[str, List[int]] = defaultdict(list)
+        by_wcag: Dict[str, List[int]] = defaultdict(list)
+        for i, item in enumerate(items):
+            by_category[item["category"]].append(i)
+            by_priority[item["priority"]].append(i)
+            by_wcag[item["wcag_reference"]].append(i)
+        return cls(
+            ids=tuple(i["id"] for i in items),
+            categories=tuple(i["category"] for i in items),
+            test_items=tuple(i["test_item"] for i in items),
+            how_to_test_blobs=tuple(compress(i["how_to_test"]) for i in items),
+            what_to_look_for_blobs=tuple(
+                compress(i["what_to_look_for"]) for i in items
+            ),
+            prose_dict=prose_dict,
+            wcag_references=tuple(i["wcag_reference"] for i in items),
+            priorities=array.array(
+                "B", (_PRIORITY_LEVELS[i["priority"]] for i in items)
+            ),
+            estimated_times=array.array("B", (i["estimated_time"] for i in items)),
+            by_category={k: tuple(v) for k, v in by_category.items()},
+            by_priority={k: tuple(v) for k, v in by_priority.items()},
+            by_wcag={k: tuple(v) for k, v in by_wcag.items()},
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _inflate(self, blob: bytes) -> str:
+        d = zlib.decompressobj(zdict=self.prose_dict)
+        return (d.decompress(blob) + d.flush()).decode("utf-8")
+
+    def how_to_test(self, i: int) -> str:
+        """Inflate row i's how_to_test prose."""
+        return self._inflate(self.how_to_test_blobs[i])
+
+    def what_to_look_for(self, i: int) -> str:
+        """Inflate row i's what_to_look_for prose."""
+        return self._inflate(self.what_to_look_for_blobs[i])
+
+    def how_to_test_steps(self, i: int) -> Tuple[str, ...]:
+        """Row i's how_to_test prose as pooled step lines."""
+        return split_steps(self.how_to_test(i))
+
+    def wcag(self, i: int) -> WCAGRef:
+        """Row i's WCAG reference as a parsed (code, title, level) record."""
+        return parse_wcag_reference(self.wcag_references[i])
+
+    def what_to_look_for_lines(self, i: int) -> Tuple[str, ...]:
+        """Row i's what_to_look_for prose as pre-split bullet lines."""
+        return split_criteria_lines(self.what_to_look_for(i))
+
+    def criteria(self, i: int) -> Tuple[Tuple[Optional[bool], str], ...]:
+        """Row i's pass/fail criteria as structured (is_pass, text) pairs."""
+        return parse_criteria(self.what_to_look_for(i))
+
+    def row(self, i: int) -> ChecklistItemDict:
+        """Rehydrate row i as an item dict (for AoS-style consumers)."""
+        return {
+            "id": self.ids[i],
+            "category": self.categories[i],
+            "test_item": self.test_items[i],
+            "how_to_test": self.how_to_test(i),
+            "what_to_look_for": self.what_to_look_for(i),
+            "wcag_reference": self.wcag_references[i],
+            "priority": _LEVEL_NAMES[self.priorities[i]],
+            "estimated_time": self.estimated_times[i],
+        }
+
+    def total_time(self, priority: Optional[str] = None) -> int:
+        """Total estimated minutes, optionally restricted to one priority."""
+        if priority is None:
+            return sum(self.estimated_times)
+        level = _PRIORITY_LEVELS[priority]
+        return sum(
+            t for t, p in zip(self.estimated_times, self.priorities) if p == level
+        )
+
+    def item(self, i: int) -> ChecklistItem:
+        """Row i as a compact ChecklistItem record."""
+        return ChecklistItem(
+            self.ids[i],
+            self.categories[i],
+            self.test_items[i],
+            self.how_to_test(i),
+            self.what_to_look_for(i),
+            self.wcag_references[i],
+            _LEVEL_NAMES[self.priorities[i]],
+            self.estimated_times[i],
+        )
+
+    def filter_by_priority(self, priority: str) -> Tuple[int, ...]:
+        """Row indices whose priority matches (prebuilt index lookup)."""
+        return self.by_priority.get(priority, ())
+
+    def filter_by_category(self, category: str) -> Tuple[int, ...]:
+        """Row indices whose category matches (prebuilt index lookup)."""
+        return self.by_category.get(category, ())
+
+    def filter_by_wcag(self, wcag_reference: str) -> Tuple[int, ...]:
+        """Row indices whose wcag_reference matches (prebuilt index lookup)."""
+        return self.by_wcag.get(wcag_reference, ())
+
+    def total_time_for(self, rows: Tuple[int, ...]) -> int:
+        """Total estimated minutes for a set of row indices (e.g. the
+        result of filter()), summed over the packed byte column."""
+        times = self.estimated_times
+        return sum(times[i] for i in rows)
+
+    def filter(
+        self,
+        category: Optional[str] = None,
+        priority: Optional[str] = None,
+    ) -> Tuple[int, ...]:
+        """
+        Row indices matching all given constraints.
+
+        Uses the prebuilt indices: single-constraint queries return the
+        shared tuple directly, and combined queries intersect the two
+        index tuples (tens of entries) instead of walking every row.
+        """
+        if category is None and priority is None:
+            return tuple(range(len(self.ids)))
+        if priority is None:
+            return self.by_category.get(category, ())
+        if category is None:
+            return self.by_priority.get(priority, ())
+        in_priority = set(self.by_priority.get(priority, ()))
+        return tuple(
+            i for i in self.by_category.get(category, ()) if i in in_priority
+        )
+
+    def filter_min_priority(self, minimum: PriorityLevel) -> Tuple[int, ...]:
+        """Row indices at or above a priority level (integer compares)."""
+        col = self.priorities
+        return tuple(i for i in range(len(col)) if col[i] >= minimum)
+
+    def items_by_category(self, category: str) -> Tuple[ChecklistItemDict, ...]:
+        """Rehydrated item dicts for one category."""
+        return tuple(self.row(i) for i in self.by_category.get(category, ()))
+
+
+@lru_cache(maxsize=64)
+def get_page_type_table(page_type: str) -> ChecklistTable:
+    """Columnar view of base + page-type checklist, built once per type."""
+    return ChecklistTable.from_items(get_page_type_checklist(page_type))
+
+
+@lru_cache(maxsize=64)
+def get_page_type_items(page_type: str) -> Tuple[ChecklistItem, ...]:
+    """Base + page-type checklist as compact ChecklistItem records."""
+    table = get_page_type_table(page_type)
+    return tuple(table.item(i) for i in range(len(table)))
+
+
+@lru_cache(maxsize=32)
+def get_component_table(component: str) -> ChecklistTable:
+    """Columnar view of one component's checklist, built once."""
+    return ChecklistTable.from_items(get_component_checklist(component))
+
+
+@lru_cache(maxsize=32)
+def get_component_items(component: str) -> Tuple[ChecklistItem, ...]:
+    """One component's checklist as compact ChecklistItem records."""
+    table = get_component_table(component)
+    return tuple(table.item(i) for i in range(len(table)))
+
+
+@lru_cache(maxsize=None)
+def render_item_html(item_id: str) -> str:
+    """
+    HTML snippet for one checklist item: numbered steps as an <ol> and
+    pass/fail criteria as <li class="pass"/"fail"> entries. Items are
+    immutable, so the render is cached forever per id and repeat renders
+    are a dict probe instead of re-splitting and re-escaping the prose.
+
+    Raises KeyError for an unknown id.
+    """
+    item = _id_index()[item_id]
+    steps = "".join(
+        f"<li>{html.escape(step)}</li>" for step in split_steps(item["how_to_test"])
+    )
+    _classes = {True: "pass", False: "fail", None: "note"}
+    criteria = "".join(
+        f'<li class="{_classes[is_pass]}">{html.escape(text)}</li>'
+        for is_pass, text in parse_criteria(item["what_to_look_for"])
+    )
+    return (
+        f'<section id="{html.escape(item["id"])}">'
+        f'<h3>{html.escape(item["test_item"])}</h3>'
+        f"<ol>{steps}</ol><ul>{criteria}</ul></section>"
+    )
+
+
+@lru_cache(maxsize=64)
+def get_stats(page_type: str) -> Dict[str, Any]:
+    """
+    Precomputed summary for a page type's checklist: total estimated
+    minutes and item counts per priority. The templates are static, so
+    this is an O(1) lookup after the first call per page type.
+    """
+    table = get_page_type_table(page_type)
+    return {
+        "total_items": len(table),
+        "total_minutes": table.total_time(),
+        "priority_counts": {
+            name: len(table.by_priority.get(name, ())) for name in _LEVEL_NAMES
+        },
+    }
+
+
@@ -1,6 +1,16 @@
-from pydantic import BaseModel, Field
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from functools import cached_property, lru_cache
+from pydantic import BaseModel
 from typing import List, Optional, Dict, Union
 from enum import Enum
+import json
+import re
+
+try:  # optional fast serializer, same fallback shape as the pa11y scanner
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 class Priority(str, Enum):
     CRITICAL = "critical"
@@ -9,32 +19,81 @@ class Priority(str, Enum):
     LOW = "low"
 
 
-class AccessibilityIssue(BaseModel):
+# axe impact string -> Priority, used on the per-issue fallback path when
+# no AI analysis is attached. A dict lookup replaces the old if/elif chain.
+_IMPACT_TO_PRIORITY: Dict[str, Priority] = {
+    "critical": Priority.CRITICAL,
+    "serious": Priority.HIGH,
+    "high": Priority.HIGH,
+    "moderate": Priority.MEDIUM,
+    "medium": Priority.MEDIUM,
+    "minor": Priority.LOW,
+    "low": Priority.LOW,
+}
+
+
+# The hot models below (one instance per issue, built in the analyzer's main
+# loop) are slotted dataclasses rather than pydantic models: no per-instance
+# __dict__ and C-level slot access in the counting/summary loops. Inputs are
+# coerced defensively by the analyzer before construction.
+@dataclass(slots=True)
+class AccessibilityIssue:
     id: str
     description: str
     impact: str
-    elements: List[str] = Field(default_factory=list)  # safe mutable default
+    elements: List[str] = field(default_factory=list)  # safe mutable default
+
+    def dict(self) -> dict:
+        return asdict(self)
 
 
-class FixSuggestion(BaseModel):
+@dataclass(slots=True)
+class FixSuggestion:
     title: str
     description: str
     code_before: Optional[str] = None
     code_after: Optional[str] = None
-    effort_minutes: int
+    effort_minutes: int = 15
+
+    def dict(self) -> dict:
+        return asdict(self)
+
+
+# First 8 whitespace-separated words of a title, matched in one scan
+# instead of split() + slice + join.
+_TITLE_RE = re.compile(r"^\s*((?:\S+\s+){0,7}\S+)")
 
 
-class AIAnalysis(BaseModel):
+@lru_cache(maxsize=256)
+def _shared_fix_suggestion(title: str, description: str, effort_minutes: int) -> FixSuggestion:
+    """Build-or-reuse a FixSuggestion.
+
+    Many issues map to the same suggestion text (one per rule, usually),
+    so identical (title, description, effort) triples share one instance.
+    Shared instances are read-only by convention: consumers only
+    serialize them.
+    """
+    return FixSuggestion(
+        title=title,
+        description=description,
+        code_before=None,
+        code_after=None,
+        effort_minutes=effort_minutes,
+    )
+
+
+@dataclass(slots=True)
+class AIAnalysis:
     priority: Priority = Priority.MEDIUM
     user_impact: str = ""
     fix_suggestion: str = ""
     effort_minutes: int = 15
     # Rich optional fields
     code_example: Optional[str] = None
-    wcag_refs: List[str] = Field(default_factory=list)
-    acceptance_criteria: List[str] = Field(default_factory=list)
-    test_steps: List[str] = Field(default_factory=list)
-    automation_hints: List[str] = Field(default_factory=list)
+    wcag_refs: List[str] = field(default_factory=list)
+    acceptance_criteria: List[str] = field(default_factory=list)
+    test_steps: List[str] = field(default_factory=list)
+    automation_hints: List[str] = field(default_factory=list)
     personas_impact: Optional[Dict[str, str]] = None
     root_cause_hypothesis: Optional[str] = None
     component_guess: Optional[str] = None
@@ -44,43 +103,44 @@ class AIAnalysis(BaseModel):
     confidence: Optional[int] = None
     risk_level: Optional[str] = None
 
+    def dict(self) -> dict:
+        return asdict(self)
+
     def to_fix_suggestion(self) -> FixSuggestion:
         """Convert AI analysis to a FixSuggestion object"""
-        title = (self.fix_suggestion or "").strip()
-        if len(title.split()) > 8:
-            title = " ".join(title.split()[:8]) + "..."
-        return FixSuggestion(
-            title=title or "Accessibility Fix",
-            description=self.fix_suggestion or "Review the issue and apply an appropriate fix.",
-            code_before=None,
-            code_after=None,
-            effort_minutes=self.effort_minutes,
+        raw = (self.fix_suggestion or "").strip()
+        m = _TITLE_RE.match(raw)
+        title = m.group(1) if m else ""
+        if len(title) < len(raw):
+            title += "..."
+        return _shared_fix_suggestion(
+            title or "Accessibility Fix",
+            self.fix_suggestion or "Review the issue and apply an appropriate fix.",
+            self.effort_minutes,
         )
 
 
 
-class EnhancedIssue(BaseModel):
+@dataclass(slots=True)
+class EnhancedIssue:
     original_issue: AccessibilityIssue
     ai_analysis: Optional[AIAnalysis] = None
     analysis_source: str = "rule_based"
 
-    class Config:
-        arbitrary_types_allowed = True  # keep if you pass non-pydantic types around
+    def dict(self) -> dict:
+        return asdict(self)
 
     @property
     def priority(self) -> Priority:
         if self.ai_analysis and self.ai_analysis.priority:
             return self.ai_analysis.priority
-        impact = (self.original_issue.impact or "").lower()
-        if impact == "critical":
-            return Priority.CRITICAL
-        if impact in ("serious", "high"):
-            return Priority.HIGH
-        if impact in ("moderate", "medium"):
-            return Priority.MEDIUM
-        if impact in ("minor", "low"):
-            return Priority.LOW
-        return Priority.MEDIUM
+        impact = self.original_issue.impact or ""
+        # Adapters emit lowercase impacts, so the raw string usually hits
+        # directly; only odd-cased input pays for a .lower() copy.
+        priority = _IMPACT_TO_PRIORITY.get(impact)
+        if priority is None:
+            priority = _IMPACT_TO_PRIORITY.get(impact.lower(), Priority.MEDIUM)
+        return priority
 
     @property
     def user_impact(self) -> str:
@@ -106,12 +166,10 @@ class EnhancedIssue(BaseModel):
             return [self.ai_analysis.to_fix_suggestion()]
         # Fallback generic suggestion
         return [
-            FixSuggestion(
-                title="Review and fix issue",
-                description="Follow accessibility guidelines (WCAG) to address this issue.",
-                code_before=None,
-                code_after=None,
-                effort_minutes=self.effort_minutes,
+            _shared_fix_suggestion(
+                "Review and fix issue",
+                "Follow accessibility guidelines (WCAG) to address this issue.",
+                self.effort_minutes,
             )
         ]
 
@@ -133,45 +191,59 @@ class AnalysisResult(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-    @property
+    @cached_property
     def summary(self) -> Dict[str, Union[int, str]]:
-        counts: Dict[str, Union[int, str]] = {
-            "total_issues": 0,
-            "critical_issues": 0,
-            "high_issues": 0,
-            "medium_issues": 0,
-            "low_issues": 0,
-        }
+        # Cached: results are effectively immutable once built (the
+        # analyzer constructs them in one shot), and callers read summary
+        # several times per request. Rebuild the result to recompute.
+        by_priority: "Counter[Priority]" = Counter()
         total_minutes = 0
         ai_count = 0
         for e in self.enhanced_issues:
-            counts["total_issues"] = int(counts["total_issues"]) + 1
-            pr = e.priority
-            if pr == Priority.CRITICAL:
-                counts["critical_issues"] = int(counts["critical_issues"]) + 1
-            elif pr == Priority.HIGH:
-                counts["high_issues"] = int(counts["high_issues"]) + 1
-            elif pr == Priority.MEDIUM:
-                counts["medium_issues"] = int(counts["medium_issues"]) + 1
-            else:
-                counts["low_issues"] = int(counts["low_issues"]) + 1
-
+            by_priority[e.priority] += 1
             total_minutes += e.effort_minutes
             if e.analysis_source == "ai_enhanced":
                 ai_count += 1
 
-        parts: List[str] = []
-        if counts["critical_issues"]:
-            parts.append(f"{counts['critical_issues']} critical")
-        if counts["high_issues"]:
-            parts.append(f"{counts['high_issues']} high")
-        if counts["medium_issues"]:
-            parts.append(f"{counts['medium_issues']} medium")
-        if counts["low_issues"]:
-            parts.append(f"{counts['low_issues']} low")
+        parts = [
+            f"{by_priority[p]} {p.value}"
+            for p in (Priority.CRITICAL, Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+            if by_priority[p]
+        ]
         summary_text = (", ".join(parts) + " issues detected") if parts else "No issues detected"
 
-        counts["estimated_total_time_minutes"] = total_minutes
-        counts["ai_enhanced_issues"] = ai_count
-        counts["summary"] = summary_text
-        return counts
+        return {
+            "total_issues": len(self.enhanced_issues),
+            "critical_issues": by_priority[Priority.CRITICAL],
+            "high_issues": by_priority[Priority.HIGH],
+            "medium_issues": by_priority[Priority.MEDIUM],
+            "low_issues": by_priority[Priority.LOW],
+            "estimated_total_time_minutes": total_minutes,
+            "ai_enhanced_issues": ai_count,
+            "summary": summary_text,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the full result straight to UTF-8 JSON bytes.
+
+        Uses orjson when installed (C serializer, no intermediate str);
+        otherwise stdlib json with a default hook for any stray enum or
+        dataclass values.
+        """
+        payload = {
+            "url": self.url,
+            "framework": self.framework,
+            "summary": self.summary,
+            "enhanced_issues": [e.dict() for e in self.enhanced_issues],
+        }
+        if orjson is not None:
+            return orjson.dumps(payload)
+
+        def _default(obj: object) -> object:
+            if isinstance(obj, Enum):
+                return obj.value
+            if hasattr(obj, "dict"):
+                return obj.dict()
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+        return json.dumps(payload, default=_default).encode("utf-8")
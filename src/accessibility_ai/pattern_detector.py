@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import List
 
 from .models import EnhancedIssue
@@ -12,10 +13,7 @@ def detect_patterns(issues: List[EnhancedIssue]) -> List[str]:
     patterns: List[str] = []
 
     # Count by rule id
-    by_rule = {}
-    for ei in issues:
-        rid = ei.original_issue.id
-        by_rule[rid] = by_rule.get(rid, 0) + 1
+    by_rule = Counter(ei.original_issue.id for ei in issues)
     for rid, count in by_rule.items():
         if count >= 10:
             patterns.append(f"Systemic {rid} issue ({count} instances)")
@@ -23,13 +21,14 @@ def detect_patterns(issues: List[EnhancedIssue]) -> List[str]:
             patterns.append(f"Recurring {rid} issue ({count} instances)")
 
     # Count by exact selector
-    by_selector = {}
-    for ei in issues:
-        for sel in ei.original_issue.elements or []:
-            by_selector[sel] = by_selector.get(sel, 0) + 1
-    frequent_selectors = [s for s, c in by_selector.items() if c >= 5]
+    by_selector = Counter(
+        sel for ei in issues for sel in ei.original_issue.elements or []
+    )
+    frequent_selectors = [
+        s for s, c in by_selector.most_common() if c >= 5
+    ][:5]
     if frequent_selectors:
-        top = ", ".join(frequent_selectors[:5])
+        top = ", ".join(frequent_selectors)
         patterns.append(f"Frequently affected selectors: {top}")
 
     return patterns
@@ -1,12 +1,77 @@
 
+import threading
+
 from .models import Priority, AccessibilityIssue
 from .wcag import get_rule_database
-from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import count
+from typing import List, Dict, Any, Optional, Tuple
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# User-impact phrasings per priority, built once at import. Tuples (not
+# lists) so the table is immutable and shared; a per-priority round-robin
+# counter replaces random.choice so repeated calls stay allocation-free
+# and deterministic while still varying the wording.
+_IMPACT_TEMPLATES: Dict[Priority, Tuple[str, ...]] = {
+    Priority.CRITICAL: (
+        "Completely blocks users with disabilities from completing tasks",
+        "Prevents access to core functionality for assistive technology users",
+        "Makes the application unusable for keyboard-only or screen reader users",
+    ),
+    Priority.HIGH: (
+        "Significantly hinders user experience for people with disabilities",
+        "Causes major difficulties in completing important tasks",
+        "Creates substantial barriers for users with specific needs",
+    ),
+    Priority.MEDIUM: (
+        "Causes inconvenience and extra effort for some users",
+        "Makes certain tasks more difficult than necessary",
+        "Affects user experience but doesn't block core functionality",
+    ),
+    Priority.LOW: (
+        "Minor usability issue that could be improved",
+        "Enhancement that would benefit some users",
+        "Cosmetic or minor functional improvement",
+    ),
+}
+
+_IMPACT_COUNTERS: Dict[Priority, "count[int]"] = {p: count() for p in _IMPACT_TEMPLATES}
+
+# Scans repeat the same rule descriptions and impact strings across many
+# issues; caching the lowercased form skips the str allocation on repeats.
+_lower = lru_cache(maxsize=1024)(str.lower)
+
+# Base score contribution per axe impact level (unknown impacts get 20).
+_IMPACT_SCORES = {
+    "critical": 80,
+    "serious": 60,
+    "moderate": 30,
+    "minor": 10,
+}
+
+# Score thresholds and the priority band each one opens; bisect_right on
+# the thresholds maps a 0-100 score straight to its band.
+_SCORE_THRESHOLDS = (30, 60, 80)
+_SCORE_PRIORITIES = (Priority.LOW, Priority.MEDIUM, Priority.HIGH, Priority.CRITICAL)
+
+# Base fix-time estimate (minutes) per priority band.
+_BASE_FIX_MINUTES = {
+    Priority.CRITICAL: 45,
+    Priority.HIGH: 25,
+    Priority.MEDIUM: 15,
+    Priority.LOW: 5,
+}
+
+# Selector fragments that mark critical user flows (login, checkout, ...).
+_CRITICAL_FLOW_RE = re.compile(
+    "login|signin|checkout|payment|submit|buy|purchase|"
+    "register|signup|contact|search|nav|menu"
+)
+
 
 class IssuePrioritizer:
     """
@@ -36,120 +101,103 @@ class IssuePrioritizer:
             "multiple ways", "consistent navigation"
         ]
 
+        # Compiled alternations of the phrase lists above: one C-level
+        # regex scan over the description replaces a Python loop of `in`
+        # checks per issue.
+        self._critical_re = re.compile("|".join(map(re.escape, self.critical_blockers)))
+        self._high_re = re.compile("|".join(map(re.escape, self.high_impact)))
+
+        # rule_id -> (has_rule, requires_ai); scans hit the same handful of
+        # rule ids repeatedly, so pay the database lookups once per rule.
+        self._enrich_cache: Dict[str, Tuple[bool, bool]] = {}
+
+        # Optional thread-safe AI budget (see set_ai_budget). When unset,
+        # should_enrich falls back to the legacy context-dict counters.
+        self._ai_budget: Optional[threading.BoundedSemaphore] = None
+
+    def set_ai_budget(self, max_calls: int) -> None:
+        """Install a thread-safe AI call budget for this prioritizer.
+
+        Concurrent scans sharing one prioritizer can race on the mutable
+        ai_calls_used counter in the context dict; a BoundedSemaphore
+        makes each permit hand-off atomic. Pass 0 to disable AI entirely.
+        """
+        self._ai_budget = threading.BoundedSemaphore(max_calls) if max_calls > 0 else None
+        if max_calls <= 0:
+            # Sentinel: an exhausted one-permit semaphore denies everything.
+            self._ai_budget = threading.BoundedSemaphore(1)
+            self._ai_budget.acquire()
+
     def calculate_priority_score(self, issue: AccessibilityIssue, context: Optional[Dict[str, Any]] = None) -> int:
         """Calculate priority score (0-100) for an issue"""
         if context is None:
             context = {}
-        
-        score = 0
-        
-        # Base impact score
-        impact_scores = {
-            "critical": 80, 
-            "serious": 60, 
-            "moderate": 30, 
-            "minor": 10
-        }
-        score += impact_scores.get(issue.impact.lower(), 20)
-        
-        # Critical blocker patterns
-        description_lower = issue.description.lower()
-        for pattern in self.critical_blockers:
-            if pattern in description_lower:
-                score += 40
-                break
-                
-        # High impact patterns
-        for pattern in self.high_impact:
-            if pattern in description_lower:
-                score += 25
-                break
-        
-        # User flow importance
-        if self._is_in_critical_flow(issue, context):
-            score += 20
-            
-        # Affected elements count
-        element_count = len(issue.elements)
-        if element_count > 10:
-            score += 15
-        elif element_count > 5:
-            score += 10
-        elif element_count > 1:
-            score += 5
-            
+
+        description_lower = _lower(issue.description)
+        n = len(issue.elements)
+        # Straight-line sum: bools multiply to 0/1, so every term is
+        # computed without a branch and the element tiers (>1 +5, >5 +10,
+        # >10 +15) fall out of three stacked comparisons.
+        score = (
+            _IMPACT_SCORES.get(_lower(issue.impact), 20)
+            + 40 * bool(self._critical_re.search(description_lower))
+            + 25 * bool(self._high_re.search(description_lower))
+            + 20 * self._is_in_critical_flow(issue, context)
+            + 5 * ((n > 1) + (n > 5) + (n > 10))
+        )
         return min(score, 100)  # Cap at 100
     
+    def calculate_priority_scores(self, issues: List[AccessibilityIssue], context: Optional[Dict[str, Any]] = None) -> List[int]:
+        """Score a whole batch of issues in one tight loop.
+
+        Same arithmetic as calculate_priority_score, with the attribute
+        and method lookups hoisted out of the loop. Pure Python on
+        purpose: at typical scan sizes (tens to low hundreds of issues)
+        the fixed cost of an array library would swamp the win.
+        """
+        if context is None:
+            context = {}
+        impact_get = _IMPACT_SCORES.get
+        critical_search = self._critical_re.search
+        high_search = self._high_re.search
+        in_flow = self._is_in_critical_flow
+        scores: List[int] = []
+        append = scores.append
+        for issue in issues:
+            description_lower = _lower(issue.description)
+            n = len(issue.elements)
+            score = (
+                impact_get(_lower(issue.impact), 20)
+                + 40 * bool(critical_search(description_lower))
+                + 25 * bool(high_search(description_lower))
+                + 20 * in_flow(issue, context)
+                + 5 * ((n > 1) + (n > 5) + (n > 10))
+            )
+            append(min(score, 100))
+        return scores
+
     def _is_in_critical_flow(self, issue: AccessibilityIssue, context: Dict[str, Any]) -> bool:
         """Check if issue is in critical user flow (login, checkout, etc.)"""
-        critical_selectors = [
-            "login", "signin", "checkout", "payment", "submit", "buy", "purchase",
-            "register", "signup", "contact", "search", "nav", "menu"
-        ]
-        
-        for element in issue.elements:
-            element_lower = element.lower()
-            if any(selector in element_lower for selector in critical_selectors):
-                return True
-        return False
+        if not issue.elements:
+            return False
+        # One regex search over all selectors joined, instead of a nested
+        # Python loop of substring checks per element.
+        return _CRITICAL_FLOW_RE.search(_lower("\n".join(issue.elements))) is not None
     
     def score_to_priority(self, score: int) -> Priority:
         """Convert numerical score to priority level"""
-        if score >= 80:
-            return Priority.CRITICAL
-        elif score >= 60:
-            return Priority.HIGH
-        elif score >= 30:
-            return Priority.MEDIUM
-        else:
-            return Priority.LOW
+        return _SCORE_PRIORITIES[bisect_right(_SCORE_THRESHOLDS, score)]
     
     def estimate_fix_time(self, issue: AccessibilityIssue, priority: Priority) -> int:
         """Estimate fix time in minutes based on issue complexity"""
-        base_times = {
-            Priority.CRITICAL: 45,
-            Priority.HIGH: 25,
-            Priority.MEDIUM: 15,
-            Priority.LOW: 5
-        }
-        
-        # Adjust for complexity
-        complexity_multiplier = 1.0
-        if len(issue.elements) > 10:
-            complexity_multiplier = 2.0
-        elif len(issue.elements) > 5:
-            complexity_multiplier = 1.5
-            
-        return int(base_times[priority] * complexity_multiplier)
+        n = len(issue.elements)
+        multiplier = 2.0 if n > 10 else 1.5 if n > 5 else 1.0
+        return int(_BASE_FIX_MINUTES[priority] * multiplier)
     
     def generate_user_impact(self, issue: AccessibilityIssue, priority: Priority) -> str:
         """Generate human-readable user impact description"""
-        impact_templates = {
-            Priority.CRITICAL: [
-                "Completely blocks users with disabilities from completing tasks",
-                "Prevents access to core functionality for assistive technology users",
-                "Makes the application unusable for keyboard-only or screen reader users"
-            ],
-            Priority.HIGH: [
-                "Significantly hinders user experience for people with disabilities",
-                "Causes major difficulties in completing important tasks",
-                "Creates substantial barriers for users with specific needs"
-            ],
-            Priority.MEDIUM: [
-                "Causes inconvenience and extra effort for some users",
-                "Makes certain tasks more difficult than necessary",
-                "Affects user experience but doesn't block core functionality"
-            ],
-            Priority.LOW: [
-                "Minor usability issue that could be improved",
-                "Enhancement that would benefit some users",
-                "Cosmetic or minor functional improvement"
-            ]
-        }
-        
-        import random
-        templates = impact_templates[priority]
-        return random.choice(templates)
+        templates = _IMPACT_TEMPLATES[priority]
+        return templates[next(_IMPACT_COUNTERS[priority]) % len(templates)]
 
     def should_enrich(self, issue: AccessibilityIssue, context: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -166,31 +214,46 @@ class IssuePrioritizer:
         """
         ctx = context or {}
         
-        # Check AI budget first (hard limit)
-        ai_calls_used = ctx.get('ai_calls_used', 0)
-        max_ai_calls = ctx.get('max_ai_calls', 5)  # Default: max 5 AI calls per scan
-        
-        if ai_calls_used >= max_ai_calls:
-            logger.info(f"AI budget exhausted ({ai_calls_used}/{max_ai_calls}), using rule database")
-            return False
+        # Check AI budget first (hard limit). The legacy context counters
+        # short-circuit here; the semaphore budget (set_ai_budget) is only
+        # consumed at the point a True decision is reached below.
+        if self._ai_budget is None:
+            ai_calls_used = ctx.get('ai_calls_used', 0)
+            max_ai_calls = ctx.get('max_ai_calls', 5)  # Default: max 5 AI calls per scan
+
+            if ai_calls_used >= max_ai_calls:
+                logger.info("AI budget exhausted (%d/%d), using rule database", ai_calls_used, max_ai_calls)
+                return False
         
-        # Check if rule exists in database
+        # Check if rule exists in database (cached per rule id)
         rule_id = issue.id or ""
-        has_rule = self.rule_db.has_rule(rule_id)
-        
+        cached = self._enrich_cache.get(rule_id)
+        if cached is None:
+            has_rule = self.rule_db.has_rule(rule_id)
+            requires_ai = has_rule and self.rule_db.requires_ai_enhancement(rule_id)
+            self._enrich_cache[rule_id] = (has_rule, requires_ai)
+        else:
+            has_rule, requires_ai = cached
+
         if not has_rule:
             # Unknown rule - use AI to analyze
-            logger.info(f"Unknown rule '{rule_id}', will use AI")
-            return True
-        
-        # Check if rule requires AI enhancement
-        requires_ai = self.rule_db.requires_ai_enhancement(rule_id)
+            logger.info("Unknown rule '%s', will use AI", rule_id)
+            return self._consume_budget(rule_id)
         
         if requires_ai:
             # Rule explicitly needs AI (e.g., color-contrast needs specific color suggestions)
-            logger.info(f"Rule '{rule_id}' requires AI for context-specific analysis")
-            return True
+            logger.info("Rule '%s' requires AI for context-specific analysis", rule_id)
+            return self._consume_budget(rule_id)
         
         # Rule database has complete guidance - no AI needed!
-        logger.info(f"Rule '{rule_id}' has complete guidance in database, skipping AI")
+        logger.info("Rule '%s' has complete guidance in database, skipping AI", rule_id)
+        return False
+
+    def _consume_budget(self, rule_id: str) -> bool:
+        """Atomically take one AI permit; always True on the legacy path."""
+        if self._ai_budget is None:
+            return True
+        if self._ai_budget.acquire(blocking=False):
+            return True
+        logger.info("AI budget exhausted, using rule database for '%s'", rule_id)
         return False
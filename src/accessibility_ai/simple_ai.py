@@ -2,17 +2,40 @@ import os
 import requests
 import json
 import logging
+import random
+import re
+import sys
 import time
 import asyncio
 import aiohttp
+import statistics
+from collections import OrderedDict, deque
 from threading import Lock
-from typing import Dict, Any, Optional, List, Literal
+from typing import Dict, Any, Optional, List, Literal, Tuple
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from pydantic import BaseModel, Field, ValidationError
 
+try:  # optional fast parser, same fallback shape as the pa11y scanner
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _dumps_bytes = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+
 try:
     from dotenv import load_dotenv, find_dotenv  # type: ignore
     load_dotenv(find_dotenv(usecwd=True), override=False)
@@ -25,28 +48,295 @@ logger = logging.getLogger(__name__)
 # Version tag for prompt templates; bump when changing prompt shape materially
 PROMPT_VERSION = "v1"
 
+# Bound on the in-process AI response cache (entries, LRU eviction).
+_RESPONSE_CACHE_SIZE = 512
+
+# Async 429 handling: how many times to retry and the backoff base. The
+# sync path keeps urllib3's Retry for this; aiohttp has no equivalent
+# built in.
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BASE_DELAY = 1.0
+
+@lru_cache(maxsize=256)
+def _norm_key(value: str) -> str:
+    """Lowercase and intern a rule id / framework / impact string.
+
+    Scans repeat the same handful of values, so after the first call the
+    canonical interned copy comes back from the cache and later dict
+    lookups hash/compare by pointer.
+    """
+    return sys.intern(value.lower())
+
+
+# Markdown fence around a JSON body, captured in one pass (``` or
+# ```json, optionally unterminated).
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+
+# Constant system message shared by every chat-completion payload.
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a web accessibility expert. Always respond with valid JSON.",
+}
+
+# Few-shot style: a single compact example to calibrate output (not a strict template)
+_EXAMPLE_JSON = {
+    "priority": "high",
+    "user_impact": "Screen reader and keyboard users cannot identify the control.",
+    "fix_suggestion": "Provide an accessible name via visible text or aria-label matching intent.",
+    "effort_minutes": 15,
+    "wcag_refs": ["WCAG 4.1.2"],
+    "acceptance_criteria": [
+        "Button announces a meaningful name to screen readers.",
+        "Visible label or aria-label reflects the control purpose."
+    ],
+    "test_steps": [
+        "Navigate to the control using Tab.",
+        "Verify screen reader announces a descriptive name."
+    ]
+}
+
+# The instruction block below the dynamic issue/KB text never changes, so
+# it is assembled once at import (including the serialized example).
+_PROMPT_TAIL = (
+    "Output JSON with these fields (use sensible defaults when unknown):\n"
+    "- priority: critical|high|medium|low\n"
+    "- user_impact: short explanation for real users\n"
+    "- fix_suggestion: specific action for the given framework\n"
+    "- effort_minutes: integer estimate (5-240)\n"
+    "- wcag_refs: list of WCAG references (e.g., WCAG 1.1.1)\n"
+    "- acceptance_criteria: list of concrete, testable criteria\n"
+    "- test_steps: list of succinct steps for manual testing\n"
+    "- code_example: optional short code snippet if helpful\n"
+    "- component_guess, root_cause_hypothesis: optional\n\n"
+    f"Example (for style only, do not copy literally): {_dumps(_EXAMPLE_JSON)}\n\n"
+    f"Prompt-Version: {PROMPT_VERSION}\n"
+    "Respond with ONLY valid JSON, no other text."
+)
+
+
+# Compact, framework-aware knowledge base for common rules. The nested
+# per-framework dict is authored once here and pre-flattened below into
+# _KB_FLAT keyed by (rule_id, framework), so lookups at prompt-build time
+# are a single dict hit instead of chained .get fallbacks.
+_KB_MAP: Dict[str, Dict[str, Any]] = {
+        "button-name": {
+            "wcag_refs": ["WCAG 4.1.2"],
+            "common_causes": [
+                "Icon-only buttons without aria-label",
+                "Clickable divs/spans without role/button and name",
+            ],
+            "guidance_by_framework": {
+                "html": "Use visible text or aria-label; avoid bare <div> as buttons.",
+                "react": "Provide children text or aria-label on <button>; avoid onClick on <div>.",
+            },
+            "example_by_framework": {
+                "html": "<button aria-label=\"Search\"><span class=\"icon\"></span></button>",
+                "react": "<button aria-label=\"Search\"><Icon /></button>",
+            },
+        },
+        "image-alt": {
+            "wcag_refs": ["WCAG 1.1.1"],
+            "common_causes": ["Missing alt on informative images", "Decorative images with empty alt not used"],
+            "guidance_by_framework": {
+                "html": "Provide meaningful alt for informative images; use alt=\"\" for decorative.",
+                "react": "On <img>, set alt. For background/decorative, ensure it’s ignored by AT.",
+            },
+            "example_by_framework": {
+                "html": "<img src=\"product.jpg\" alt=\"Red shoes, front view\">",
+                "react": "<img src=\"/logo.png\" alt=\"Acme Corp\" />",
+            },
+        },
+        "label": {
+            "wcag_refs": ["WCAG 3.3.2"],
+            "common_causes": ["Inputs without <label>", "Placeholder used as label"],
+            "guidance_by_framework": {
+                "html": "Associate <label for> with input id; ensure visible label.",
+                "react": "Use <label htmlFor=...> and input id; don’t rely on placeholder.",
+            },
+            "example_by_framework": {
+                "html": "<label for=\"email\">Email</label><input id=\"email\">",
+                "react": "<label htmlFor=\"email\">Email</label><input id=\"email\" />",
+            },
+        },
+        "color-contrast": {
+            "wcag_refs": ["WCAG 1.4.3"],
+            "common_causes": ["Text on brand colors below 4.5:1", "Disabled buttons with low contrast"],
+            "guidance_by_framework": {
+                "html": "Adjust colors to meet 4.5:1 normal text or 3:1 large text.",
+                "react": "Use design tokens; ensure tokens meet 4.5:1/3:1 contrast.",
+            },
+            "example_by_framework": {
+                "html": "Use #1F2937 text on #FFFFFF background for 12pt text.",
+                "react": "Apply theme variable with sufficient contrast (e.g., text-primary on bg-base).",
+            },
+        },
+        # Link purpose must be clear
+        "link-name": {
+            "wcag_refs": ["WCAG 2.4.4"],
+            "common_causes": ["Links with 'click here' or icon-only without name", "SVG/icon links lacking aria-label"],
+            "guidance_by_framework": {
+                "html": "Link text should describe destination; for icon-only, add aria-label or aria-labelledby.",
+                "react": "Provide meaningful children on <a> or aria-label; avoid ambiguous link text.",
+            },
+            "example_by_framework": {
+                "html": "<a href=\"/account\">Account settings</a>",
+                "react": "<a href=\"/cart\" aria-label=\"View shopping cart\"><CartIcon /></a>",
+            },
+        },
+        # Focus must be visible for keyboard users
+        "focus-visible": {
+            "wcag_refs": ["WCAG 2.4.7"],
+            "common_causes": ["Outline removed via CSS", "Custom components without visible focus styles"],
+            "guidance_by_framework": {
+                "html": "Ensure a visible focus indicator (:focus or :focus-visible); don’t remove outlines.",
+                "react": "Provide focus styles for interactive components; use :focus-visible or focus ring utilities.",
+            },
+            "example_by_framework": {
+                "html": "button:focus-visible{outline:2px solid #2563EB; outline-offset:2px;}",
+                "react": "<button className=\"focus:outline-blue-600 focus:outline-2\">Save</button>",
+            },
+        },
+        # Headings: order and presence
+        "heading-order": {
+            "wcag_refs": ["WCAG 1.3.1"],
+            "common_causes": ["Skipping heading levels", "Using headings for styling instead of structure"],
+            "guidance_by_framework": {
+                "html": "Use hierarchical h1–h6 without skipping; use CSS for styling instead of incorrect levels.",
+                "react": "Render correct <h*> levels based on section depth; avoid jumping from h1 to h3.",
+            },
+            "example_by_framework": {
+                "html": "<h1>Products</h1>\n<h2>Shoes</h2>\n<h3>Running</h3>",
+                "react": "<h1>Docs</h1><h2>Getting Started</h2>",
+            },
+        },
+        "page-has-heading-one": {
+            "wcag_refs": ["WCAG 1.3.1", "Best Practice"],
+            "common_causes": ["No primary page heading (h1)", "Logo used instead of heading"],
+            "guidance_by_framework": {
+                "html": "Ensure one descriptive <h1> per page near the top.",
+                "react": "Include a top-level <h1> describing the page purpose.",
+            },
+            "example_by_framework": {
+                "html": "<h1>Order Confirmation</h1>",
+                "react": "<h1>Dashboard</h1>",
+            },
+        },
+        # Landmarks/regions
+        "landmark-one-main": {
+            "wcag_refs": ["WCAG 1.3.1", "WCAG 2.4.1"],
+            "common_causes": ["Missing <main> landmark", "Multiple main regions"],
+            "guidance_by_framework": {
+                "html": "Use a single <main> for primary content; header/footer/nav as appropriate.",
+                "react": "Wrap page content in <main>; ensure only one main landmark.",
+            },
+            "example_by_framework": {
+                "html": "<main id=\"main\">...content...</main>",
+                "react": "<main role=\"main\">{children}</main>",
+            },
+        },
+        "region": {
+            "wcag_refs": ["WCAG 1.3.1", "WCAG 2.4.1"],
+            "common_causes": ["Landmarks missing labels when multiple of same type", "Overuse of generic containers"],
+            "guidance_by_framework": {
+                "html": "Label multiple nav/aside regions with aria-label; use semantic elements.",
+                "react": "For repeated landmarks, set aria-label (e.g., aria-label=\"Primary\").",
+            },
+            "example_by_framework": {
+                "html": "<nav aria-label=\"Primary\">...</nav>",
+                "react": "<nav aria-label=\"Footer links\">...</nav>",
+            },
+        },
+    }
+
+
+def _flatten_kb() -> Dict[Tuple[str, str], Any]:
+    from types import MappingProxyType
+
+    flat: Dict[Tuple[str, str], Any] = {}
+    for rid, entry in _KB_MAP.items():
+        rid = sys.intern(rid)
+        guidance = entry.get("guidance_by_framework", {})
+        example = entry.get("example_by_framework", {})
+        for fw in (sys.intern("html"), sys.intern("react")):
+            flat[(rid, fw)] = MappingProxyType({
+                "rule_id": rid,
+                "wcag_refs": entry.get("wcag_refs", []),
+                "common_causes": entry.get("common_causes", []),
+                "guidance": guidance.get(fw, guidance.get("html", "")),
+                "example": example.get(fw, example.get("html", "")),
+            })
+    return flat
+
+
+_KB_FLAT = _flatten_kb()
+
+
+@lru_cache(maxsize=1024)
+def _build_prompt_cached(
+    issue_description: str,
+    elements: Tuple[str, ...],
+    impact: Optional[str],
+    rule_id: Optional[str],
+    framework: Optional[str],
+) -> str:
+    """Build the full prompt for one issue, memoized on its inputs.
+
+    Bulk audits repeat the same (rule, selectors, description) across
+    pages; identical inputs return the already-built ~1KB string.
+    """
+    # Normalize inputs (interned so the KB tuple-key lookups below and
+    # repeat cache hits compare by pointer)
+    framework_norm = _norm_key(framework or "html")
+    elems = list(elements)  # keep prompt compact (already capped to 3)
+    elements_text = f"Affected selectors: {elems}" if elems else "Affected selectors: []"
+    impact_text = f"Impact level: {impact}" if impact else "Impact level: unknown"
+
+    # Inject compact knowledge for common rule ids
+    # Built-in compact knowledge base only (dynamic refs disabled)
+    kb = None
+    if rule_id:
+        rid = _norm_key(str(rule_id))
+        kb = _KB_FLAT.get((rid, framework_norm)) or _KB_FLAT.get((rid, "html"))
+    kb_text = ""
+    if kb:
+        kb_text = (
+            f"Rule ID: {kb.get('rule_id')}\n"
+            f"Relevant WCAG: {', '.join(kb.get('wcag_refs', []))}\n"
+            f"Common causes: {', '.join(kb.get('common_causes', []))}\n"
+            f"Guidance ({framework_norm}): {kb.get('guidance', '')}\n"
+            f"Example ({framework_norm}): {kb.get('example', '')}\n"
+        )
+
+    # Static header first and static tail last: only the issue block
+    # and KB snippet are assembled per call, and providers with
+    # prompt-prefix caches can match the constant opening text.
+    return (
+        "You are an expert web accessibility consultant. Analyze this issue and return strict JSON.\n\n"
+        f"ISSUE: {issue_description}\n{elements_text}\n{impact_text}\n\n"
+        f"Knowledge (use if relevant):\n{kb_text}\n"
+        + _PROMPT_TAIL
+    )
+
 
 def _get_cfg(name: str, default: Optional[str] = None) -> Optional[str]:
     """
     Resolve configuration from environment variables only.
-    
-    ⚠️ SECURITY: Does NOT cache sensitive values like API keys.
-    Always reads fresh from environment to avoid secrets in memory.
-    
+
+    Read once per client in __init__ and held on the instance for the
+    client's lifetime; construct a new SimpleAIClient to pick up changed
+    environment values.
+
     Order: environment variable -> default
     - .env is already loaded via python-dotenv at import time (if installed)
-    
+
     Args:
         name: Configuration variable name (e.g., 'OPENROUTER_API_KEY')
         default: Default value if not found
-        
+
     Returns:
         Configuration value or default
     """
-    val = os.getenv(name)
-    if val is not None and val != "":
-        return val
-    return default
+    return os.environ.get(name) or default
 
 
 class AIResponse(BaseModel):
@@ -72,43 +362,113 @@ class AIResponse(BaseModel):
     risk_level: Optional[str] = None
 
 
+# Served (copied) whenever a response can't be parsed; built once.
+_FALLBACK_RESPONSE = {
+    "priority": "medium",
+    "user_impact": "This accessibility issue may affect users with disabilities.",
+    "fix_suggestion": "Review and fix the accessibility issue following WCAG guidelines.",
+    "code_example": None,
+    "effort_minutes": 15,
+}
+
+# AIResponse fields surfaced to callers, in schema order. The analyzer
+# reads every key with .get defaults, so None-valued optionals can be
+# omitted from the projected dict instead of copied through.
+_OUTPUT_KEYS = tuple(AIResponse.model_fields)
+
+
 @dataclass
 class UsageStats:
-    """Track token usage and cost metrics"""
+    """Track token usage and cost metrics.
+
+    Compound updates and snapshots are guarded by a lock: each += is
+    atomic under the GIL, but without the lock a to_dict taken between
+    two updates (or from another thread mid-batch) could see e.g.
+    total_requests bumped while successful_requests is not.
+    """
     total_requests: int = 0
     successful_requests: int = 0
     failed_requests: int = 0
     total_prompt_tokens: int = 0
     total_completion_tokens: int = 0
     total_tokens: int = 0
-    estimated_cost_usd: float = 0.0
-    
+    # Cost accumulates in integer hundredths of a microdollar (1e-8 USD)
+    # so long runs don't pick up float summation drift; USD is derived on
+    # read.
+    _cost_microcents: int = field(default=0, repr=False, compare=False)
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    @property
+    def estimated_cost_usd(self) -> float:
+        return self._cost_microcents / 1e8
+
     def add_usage(self, prompt_tokens: int, completion_tokens: int, cost: float = 0.0):
         """Add usage from a single API call"""
-        self.total_requests += 1
-        self.successful_requests += 1
-        self.total_prompt_tokens += prompt_tokens
-        self.total_completion_tokens += completion_tokens
-        self.total_tokens += (prompt_tokens + completion_tokens)
-        self.estimated_cost_usd += cost
+        with self._lock:
+            self.total_requests += 1
+            self.successful_requests += 1
+            self.total_prompt_tokens += prompt_tokens
+            self.total_completion_tokens += completion_tokens
+            self.total_tokens += (prompt_tokens + completion_tokens)
+            self._cost_microcents += int(round(cost * 1e8))
     
     def add_failure(self):
         """Record a failed request"""
-        self.total_requests += 1
-        self.failed_requests += 1
+        with self._lock:
+            self.total_requests += 1
+            self.failed_requests += 1
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging/API responses"""
-        return {
-            "total_requests": self.total_requests,
-            "successful_requests": self.successful_requests,
-            "failed_requests": self.failed_requests,
-            "total_prompt_tokens": self.total_prompt_tokens,
-            "total_completion_tokens": self.total_completion_tokens,
-            "total_tokens": self.total_tokens,
-            "estimated_cost_usd": round(self.estimated_cost_usd, 4),
-            "success_rate": round(self.successful_requests / self.total_requests * 100, 2) if self.total_requests > 0 else 0.0
-        }
+        with self._lock:
+            return {
+                "total_requests": self.total_requests,
+                "successful_requests": self.successful_requests,
+                "failed_requests": self.failed_requests,
+                "total_prompt_tokens": self.total_prompt_tokens,
+                "total_completion_tokens": self.total_completion_tokens,
+                "total_tokens": self.total_tokens,
+                "estimated_cost_usd": round(self._cost_microcents / 1e8, 4),
+                "success_rate": round(self.successful_requests / self.total_requests * 100, 2) if self.total_requests > 0 else 0.0
+            }
+
+    def merge(self, batch: "_UsageBatch") -> None:
+        """Fold a batch accumulator in under one lock acquire."""
+        with self._lock:
+            self.total_requests += batch.requests
+            self.successful_requests += batch.successes
+            self.failed_requests += batch.failures
+            self.total_prompt_tokens += batch.prompt_tokens
+            self.total_completion_tokens += batch.completion_tokens
+            self.total_tokens += batch.prompt_tokens + batch.completion_tokens
+            self._cost_microcents += batch.cost_microcents
+
+
+@dataclass
+class _UsageBatch:
+    """Lock-free usage accumulator local to one batch.
+
+    Async tasks all run on one event-loop thread, so per-call updates
+    need no lock; the totals fold into the shared UsageStats with a
+    single acquire at batch end instead of N contended ones.
+    """
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_microcents: int = 0
+
+    def add_usage(self, prompt_tokens: int, completion_tokens: int, cost: float = 0.0) -> None:
+        self.requests += 1
+        self.successes += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost_microcents += int(round(cost * 1e8))
+
+    def add_failure(self) -> None:
+        self.requests += 1
+        self.failures += 1
 
 
 class SimpleAIClient:
@@ -116,15 +476,45 @@ class SimpleAIClient:
     Enhanced AI client for OpenRouter with better error handling and prompts
     """
 
-    def __init__(self):
+    # Slots: thousands of attribute reads happen per batch on these names;
+    # slot descriptors resolve at C level and drop the per-instance __dict__.
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "model",
+        "timeout",
+        "_latency_samples",
+        "_rate_limiter",
+        "_last_call_time",
+        "_min_interval",
+        "usage_stats",
+        "_response_cache",
+        "_response_cache_lock",
+        "_aio_session",
+        "_aio_session_lock",
+        "_aio_timeout",
+        "_rate_limit_gate",
+        "price_per_1m_prompt_tokens",
+        "price_per_1m_completion_tokens",
+        "session",
+        "_payload_tmpl",
+    )
+
+    def __init__(self, request_timeout: Optional[int] = None):
         self.api_key = _get_cfg('OPENROUTER_API_KEY')
         self.base_url = _get_cfg('OPENROUTER_BASE_URL', "https://openrouter.ai/api/v1")
         self.model = _get_cfg('OPENROUTER_MODEL', "tngtech/deepseek-r1t2-chimera:free")  # Default model
         try:
-            self.timeout = int(_get_cfg('OPENROUTER_TIMEOUT', "30") or "30")
+            self.timeout = request_timeout or int(_get_cfg('OPENROUTER_TIMEOUT', "30") or "30")
         except ValueError:
             self.timeout = 30
 
+        # Rolling latency window for the adaptive per-request timeout:
+        # LLM latency is heavy-tailed, so once enough samples exist we cut
+        # stragglers at 2.5x the median and retry instead of blocking the
+        # full flat timeout.
+        self._latency_samples: "deque[float]" = deque(maxlen=50)
+
         # Rate limiting setup
         self._rate_limiter = Lock()
         self._last_call_time = 0.0
@@ -132,6 +522,29 @@ class SimpleAIClient:
         
         # Usage tracking
         self.usage_stats = UsageStats()
+
+        # In-process response cache: bulk audits repeat the same issue
+        # (same rule, impact, selectors) across many pages, and every hit
+        # avoids a multi-second LLM round trip plus its token cost. Keyed
+        # by the exact prompt inputs plus PROMPT_VERSION so prompt changes
+        # invalidate naturally; LRU-bounded via OrderedDict.
+        self._response_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._response_cache_lock = Lock()
+
+        # Shared async session, created lazily on first async call so the
+        # TLS pool and DNS cache persist across requests (see
+        # _get_aio_session). Guarded by an asyncio.Lock against concurrent
+        # first calls.
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        self._aio_session_lock = asyncio.Lock()
+        # ClientTimeout is immutable; build it once instead of per request.
+        self._aio_timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        # Set (open) except while a 429 backoff is in progress; all async
+        # workers wait on it so one rate-limit response pauses the whole
+        # batch once instead of every worker retrying independently.
+        self._rate_limit_gate = asyncio.Event()
+        self._rate_limit_gate.set()
         
         # Pricing per 1M tokens (update these based on your model)
         # For free models, these will be 0
@@ -150,10 +563,35 @@ class SimpleAIClient:
             raise_on_status=False  # Don't raise exception, let us handle it
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Widen the connection pool beyond the urllib3 default of 10 so
+        # concurrent callers reuse warm TLS connections instead of paying
+        # a fresh handshake each time the pool saturates.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
+        # Constant chat-completion fields, shallow-copied per call with
+        # only the messages slot filled in.
+        self._payload_tmpl: Dict[str, Any] = {
+            "model": self.model,
+            "messages": (),
+            "max_tokens": 800,  # room for code examples
+            "temperature": 0.1,  # lower for more consistent JSON
+            "response_format": {"type": "json_object"},  # force JSON mode if supported
+        }
+
+        # Static headers set once on the session instead of per request.
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        })
+
         if not self.api_key:
             logger.warning("OpenRouter API key not found. AI features will be disabled.")
         else:
@@ -184,14 +622,39 @@ class SimpleAIClient:
         """
         if not self.is_available():
             return None
-            
+
+        cache_key = (
+            PROMPT_VERSION,
+            _norm_key(rule_id or ""),
+            _norm_key(framework or "html"),
+            _norm_key(impact or ""),
+            issue_description,
+            tuple(elements[:3]) if elements else (),
+        )
+        with self._response_cache_lock:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.debug("AI response cache hit for rule '%s'", rule_id)
+                # Shallow copy so callers can't mutate the cached entry
+                return dict(cached)
+
         prompt = self._build_comprehensive_prompt(issue_description, elements, impact, rule_id, framework)
 
         try:
             response = self._make_api_call(prompt)
-            if response:
-                return self._parse_ai_response(response)
-            return None
+            if not response:
+                return None
+            parsed = self._parse_ai_response(response)
+            # Never cache the parse-failure fallback: one garbled response
+            # must not pin generic advice for this issue for the process
+            # lifetime; the next call should retry the API instead.
+            if parsed != _FALLBACK_RESPONSE:
+                with self._response_cache_lock:
+                    self._response_cache[cache_key] = parsed
+                    if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
+            return dict(parsed)
 
         except Exception as e:
             logger.error(f"AI analysis failed: {e}")
@@ -199,363 +662,204 @@ class SimpleAIClient:
 
     def _build_comprehensive_prompt(self, issue_description: str, elements: Optional[list] = None, impact: Optional[str] = None, rule_id: Optional[str] = None, framework: Optional[str] = None) -> str:
         """Build comprehensive prompt using a compact knowledge base and structured requirements"""
-        # Normalize inputs
-        framework_norm = (framework or "html").lower()
-        elems = list(elements or [])
-        elems = elems[:3]  # keep prompt compact
-        elements_text = f"Affected selectors: {elems}" if elems else "Affected selectors: []"
-        impact_text = f"Impact level: {impact}" if impact else "Impact level: unknown"
-
-        # Inject compact knowledge for common rule ids
-        # Built-in compact knowledge base only (dynamic refs disabled)
-        kb = self._get_rule_knowledge(rule_id, framework_norm)
-        kb_text = ""
-        if kb:
-            kb_text = (
-                f"Rule ID: {kb.get('rule_id')}\n"
-                f"Relevant WCAG: {', '.join(kb.get('wcag_refs', []))}\n"
-                f"Common causes: {', '.join(kb.get('common_causes', []))}\n"
-                f"Guidance ({framework_norm}): {kb.get('guidance', '')}\n"
-                f"Example ({framework_norm}): {kb.get('example', '')}\n"
+        # Delegate to the module-level cached builder with hashable args;
+        # nothing in the prompt depends on instance state.
+        elements_key = tuple(elements[:3]) if elements else ()
+        if len(issue_description) > 2048:
+            # Oversized descriptions are one-offs; build directly instead
+            # of churning useful entries out of the LRU.
+            return _build_prompt_cached.__wrapped__(
+                issue_description, elements_key, impact, rule_id, framework
             )
-
-        # Few-shot style: a single compact example to calibrate output (not a strict template)
-        example_json = {
-            "priority": "high",
-            "user_impact": "Screen reader and keyboard users cannot identify the control.",
-            "fix_suggestion": "Provide an accessible name via visible text or aria-label matching intent.",
-            "effort_minutes": 15,
-            "wcag_refs": ["WCAG 4.1.2"],
-            "acceptance_criteria": [
-                "Button announces a meaningful name to screen readers.",
-                "Visible label or aria-label reflects the control purpose."
-            ],
-            "test_steps": [
-                "Navigate to the control using Tab.",
-                "Verify screen reader announces a descriptive name."
-            ]
-        }
-
-        prompt = (
-            "You are an expert web accessibility consultant. Analyze this issue and return strict JSON.\n\n"
-            f"ISSUE: {issue_description}\n{elements_text}\n{impact_text}\n\n"
-            f"Knowledge (use if relevant):\n{kb_text}\n"
-            "Output JSON with these fields (use sensible defaults when unknown):\n"
-            "- priority: critical|high|medium|low\n"
-            "- user_impact: short explanation for real users\n"
-            "- fix_suggestion: specific action for the given framework\n"
-            "- effort_minutes: integer estimate (5-240)\n"
-            "- wcag_refs: list of WCAG references (e.g., WCAG 1.1.1)\n"
-            "- acceptance_criteria: list of concrete, testable criteria\n"
-            "- test_steps: list of succinct steps for manual testing\n"
-            "- code_example: optional short code snippet if helpful\n"
-            "- component_guess, root_cause_hypothesis: optional\n\n"
-            f"Example (for style only, do not copy literally): {json.dumps(example_json)}\n\n"
-            f"Prompt-Version: {PROMPT_VERSION}\n"
-            "Respond with ONLY valid JSON, no other text."
+        return _build_prompt_cached(
+            issue_description, elements_key, impact, rule_id, framework
         )
-        return prompt
 
     def _get_rule_knowledge(self, rule_id: Optional[str], framework: str) -> Optional[Dict[str, Any]]:
         """Return compact, framework-aware guidance for common rules."""
         if not rule_id:
             return None
-        rid = str(rule_id).lower()
-        kb_map: Dict[str, Dict[str, Any]] = {
-            "button-name": {
-                "wcag_refs": ["WCAG 4.1.2"],
-                "common_causes": [
-                    "Icon-only buttons without aria-label",
-                    "Clickable divs/spans without role/button and name",
-                ],
-                "guidance_by_framework": {
-                    "html": "Use visible text or aria-label; avoid bare <div> as buttons.",
-                    "react": "Provide children text or aria-label on <button>; avoid onClick on <div>.",
-                },
-                "example_by_framework": {
-                    "html": "<button aria-label=\"Search\"><span class=\"icon\"></span></button>",
-                    "react": "<button aria-label=\"Search\"><Icon /></button>",
-                },
-            },
-            "image-alt": {
-                "wcag_refs": ["WCAG 1.1.1"],
-                "common_causes": ["Missing alt on informative images", "Decorative images with empty alt not used"],
-                "guidance_by_framework": {
-                    "html": "Provide meaningful alt for informative images; use alt=\"\" for decorative.",
-                    "react": "On <img>, set alt. For background/decorative, ensure it’s ignored by AT.",
-                },
-                "example_by_framework": {
-                    "html": "<img src=\"product.jpg\" alt=\"Red shoes, front view\">",
-                    "react": "<img src=\"/logo.png\" alt=\"Acme Corp\" />",
-                },
-            },
-            "label": {
-                "wcag_refs": ["WCAG 3.3.2"],
-                "common_causes": ["Inputs without <label>", "Placeholder used as label"],
-                "guidance_by_framework": {
-                    "html": "Associate <label for> with input id; ensure visible label.",
-                    "react": "Use <label htmlFor=...> and input id; don’t rely on placeholder.",
-                },
-                "example_by_framework": {
-                    "html": "<label for=\"email\">Email</label><input id=\"email\">",
-                    "react": "<label htmlFor=\"email\">Email</label><input id=\"email\" />",
-                },
-            },
-            "color-contrast": {
-                "wcag_refs": ["WCAG 1.4.3"],
-                "common_causes": ["Text on brand colors below 4.5:1", "Disabled buttons with low contrast"],
-                "guidance_by_framework": {
-                    "html": "Adjust colors to meet 4.5:1 normal text or 3:1 large text.",
-                    "react": "Use design tokens; ensure tokens meet 4.5:1/3:1 contrast.",
-                },
-                "example_by_framework": {
-                    "html": "Use #1F2937 text on #FFFFFF background for 12pt text.",
-                    "react": "Apply theme variable with sufficient contrast (e.g., text-primary on bg-base).",
-                },
-            },
-            # Link purpose must be clear
-            "link-name": {
-                "wcag_refs": ["WCAG 2.4.4"],
-                "common_causes": ["Links with 'click here' or icon-only without name", "SVG/icon links lacking aria-label"],
-                "guidance_by_framework": {
-                    "html": "Link text should describe destination; for icon-only, add aria-label or aria-labelledby.",
-                    "react": "Provide meaningful children on <a> or aria-label; avoid ambiguous link text.",
-                },
-                "example_by_framework": {
-                    "html": "<a href=\"/account\">Account settings</a>",
-                    "react": "<a href=\"/cart\" aria-label=\"View shopping cart\"><CartIcon /></a>",
-                },
-            },
-            # Focus must be visible for keyboard users
-            "focus-visible": {
-                "wcag_refs": ["WCAG 2.4.7"],
-                "common_causes": ["Outline removed via CSS", "Custom components without visible focus styles"],
-                "guidance_by_framework": {
-                    "html": "Ensure a visible focus indicator (:focus or :focus-visible); don’t remove outlines.",
-                    "react": "Provide focus styles for interactive components; use :focus-visible or focus ring utilities.",
-                },
-                "example_by_framework": {
-                    "html": "button:focus-visible{outline:2px solid #2563EB; outline-offset:2px;}",
-                    "react": "<button className=\"focus:outline-blue-600 focus:outline-2\">Save</button>",
-                },
-            },
-            # Headings: order and presence
-            "heading-order": {
-                "wcag_refs": ["WCAG 1.3.1"],
-                "common_causes": ["Skipping heading levels", "Using headings for styling instead of structure"],
-                "guidance_by_framework": {
-                    "html": "Use hierarchical h1–h6 without skipping; use CSS for styling instead of incorrect levels.",
-                    "react": "Render correct <h*> levels based on section depth; avoid jumping from h1 to h3.",
-                },
-                "example_by_framework": {
-                    "html": "<h1>Products</h1>\n<h2>Shoes</h2>\n<h3>Running</h3>",
-                    "react": "<h1>Docs</h1><h2>Getting Started</h2>",
-                },
-            },
-            "page-has-heading-one": {
-                "wcag_refs": ["WCAG 1.3.1", "Best Practice"],
-                "common_causes": ["No primary page heading (h1)", "Logo used instead of heading"],
-                "guidance_by_framework": {
-                    "html": "Ensure one descriptive <h1> per page near the top.",
-                    "react": "Include a top-level <h1> describing the page purpose.",
-                },
-                "example_by_framework": {
-                    "html": "<h1>Order Confirmation</h1>",
-                    "react": "<h1>Dashboard</h1>",
-                },
-            },
-            # Landmarks/regions
-            "landmark-one-main": {
-                "wcag_refs": ["WCAG 1.3.1", "WCAG 2.4.1"],
-                "common_causes": ["Missing <main> landmark", "Multiple main regions"],
-                "guidance_by_framework": {
-                    "html": "Use a single <main> for primary content; header/footer/nav as appropriate.",
-                    "react": "Wrap page content in <main>; ensure only one main landmark.",
-                },
-                "example_by_framework": {
-                    "html": "<main id=\"main\">...content...</main>",
-                    "react": "<main role=\"main\">{children}</main>",
-                },
-            },
-            "region": {
-                "wcag_refs": ["WCAG 1.3.1", "WCAG 2.4.1"],
-                "common_causes": ["Landmarks missing labels when multiple of same type", "Overuse of generic containers"],
-                "guidance_by_framework": {
-                    "html": "Label multiple nav/aside regions with aria-label; use semantic elements.",
-                    "react": "For repeated landmarks, set aria-label (e.g., aria-label=\"Primary\").",
-                },
-                "example_by_framework": {
-                    "html": "<nav aria-label=\"Primary\">...</nav>",
-                    "react": "<nav aria-label=\"Footer links\">...</nav>",
-                },
-            },
-        }
-        if rid not in kb_map:
-            return None
-        entry = kb_map[rid]
-        return {
-            "rule_id": rid,
-            "wcag_refs": entry.get("wcag_refs", []),
-            "common_causes": entry.get("common_causes", []),
-            "guidance": entry.get("guidance_by_framework", {}).get(framework, entry.get("guidance_by_framework", {}).get("html", "")),
-            "example": entry.get("example_by_framework", {}).get(framework, entry.get("example_by_framework", {}).get("html", "")),
-        }
+        rid = _norm_key(str(rule_id))
+        return _KB_FLAT.get((rid, framework)) or _KB_FLAT.get((rid, "html"))
+
+    def _throttle(self) -> None:
+        """Reserve the next send slot in the token bucket and sleep to it.
+
+        The lock is held only for the microseconds it takes to compute the
+        reservation, never across the network call, so N threads pipeline
+        requests at the target rate instead of serializing whole round
+        trips. time.monotonic is immune to wall-clock jumps.
+        """
+        with self._rate_limiter:
+            now = time.monotonic()
+            wait = max(0.0, self._last_call_time + self._min_interval - now)
+            self._last_call_time = now + wait
+        if wait > 0:
+            logger.debug("Rate limiting: waiting %.2fs", wait)
+            time.sleep(wait)
 
-    def _make_api_call(self, prompt: str) -> Optional[str]:
+    def _estimate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """Per-call cost in USD; zero-priced (free) models short-circuit."""
+        if not (self.price_per_1m_prompt_tokens or self.price_per_1m_completion_tokens):
+            return 0.0
+        return (
+            prompt_tokens * self.price_per_1m_prompt_tokens
+            + completion_tokens * self.price_per_1m_completion_tokens
+        ) * 1e-6
+
+    def _request_timeout(self) -> float:
+        """Adaptive timeout: 2.5x rolling median latency, floored at 5s.
+
+        Falls back to the configured flat timeout until 10 samples exist;
+        never exceeds the flat timeout.
+        """
+        if len(self._latency_samples) >= 10:
+            return min(
+                float(self.timeout),
+                max(5.0, statistics.median(self._latency_samples) * 2.5),
+            )
+        return float(self.timeout)
+
+    def _make_api_call(self, prompt: str, _is_retry: bool = False) -> Optional[str]:
         """Make the actual API call to OpenRouter with rate limiting and retry logic"""
         
-        # Apply rate limiting
-        with self._rate_limiter:
-            elapsed = time.time() - self._last_call_time
-            if elapsed < self._min_interval:
-                wait_time = self._min_interval - elapsed
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-                time.sleep(wait_time)
+        # Apply rate limiting (lock released before the network call)
+        self._throttle()
+        timeout = self.timeout if _is_retry else self._request_timeout()
+        payload = {
+            **self._payload_tmpl,
+            "messages": [_SYSTEM_MSG, {"role": "user", "content": prompt}],
+        }
+        try:
+            # Pre-serialized body (data=) skips requests' internal
+            # json.dumps; Content-Type is already on the session.
+            response = self.session.post(
+                f"{self.base_url}/chat/completions",
+                data=_dumps_bytes(payload),
+                timeout=timeout
+            )
             
-            try:
-                response = self.session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are a web accessibility expert. Always respond with valid JSON."
-                            },
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": 800,  # Increased for code examples
-                        "temperature": 0.1,  # Lower for more consistent JSON
-                        "response_format": {"type": "json_object"}  # Force JSON mode if supported
-                    },
-                    timeout=self.timeout
-                )
-                
-                # Update last call time after request completes
-                self._last_call_time = time.time()
-
-                if response.status_code == 200:
-                    data = response.json()
-                    try:
-                        choices = data.get('choices') or []
-                        if not choices:
-                            logger.error("API response has no choices field")
-                            self.usage_stats.add_failure()
-                            return None
-                        message = choices[0].get('message') or {}
-                        content = message.get('content')
-                        if not isinstance(content, str):
-                            logger.error("API response content missing or not a string")
-                            self.usage_stats.add_failure()
-                            return None
-                        
-                        # Extract usage information from response
-                        usage = data.get('usage', {})
-                        prompt_tokens = usage.get('prompt_tokens', 0)
-                        completion_tokens = usage.get('completion_tokens', 0)
-                        
-                        # Calculate cost (will be 0 for free models)
-                        cost = (
-                            (prompt_tokens / 1_000_000 * self.price_per_1m_prompt_tokens) +
-                            (completion_tokens / 1_000_000 * self.price_per_1m_completion_tokens)
-                        )
-                        
-                        # Track usage
-                        self.usage_stats.add_usage(prompt_tokens, completion_tokens, cost)
-                        
-                        logger.debug(
-                            f"API call successful (took {response.elapsed.total_seconds():.2f}s, "
-                            f"tokens: {prompt_tokens}+{completion_tokens}={prompt_tokens+completion_tokens}, "
-                            f"cost: ${cost:.4f})"
-                        )
-                        return content
-                    except Exception as e:
-                        logger.error(f"Unexpected response format: {e}")
+            if response.status_code == 200:
+                # Parse the raw bytes directly: skips requests' charset
+                # sniffing and (with orjson) the intermediate str copy.
+                data = _loads(response.content)
+                try:
+                    choices = data.get('choices') or []
+                    if not choices:
+                        logger.error("API response has no choices field")
                         self.usage_stats.add_failure()
                         return None
-                
-                elif response.status_code == 429:
-                    # Rate limit hit - the retry logic already handled retries
-                    logger.warning(f"Rate limit exceeded even after retries: {response.text}")
-                    self.usage_stats.add_failure()
-                    return None
-                
-                else:
-                    logger.error(f"API error {response.status_code}: {response.text}")
-                    # Try to get error details
-                    try:
-                        error_data = response.json()
-                        logger.error(f"API error details: {error_data}")
-                    except Exception:
-                        pass
+                    message = choices[0].get('message') or {}
+                    content = message.get('content')
+                    if not isinstance(content, str):
+                        logger.error("API response content missing or not a string")
+                        self.usage_stats.add_failure()
+                        return None
+                    
+                    # Extract usage information from response
+                    usage = data.get('usage', {})
+                    prompt_tokens = usage.get('prompt_tokens', 0)
+                    completion_tokens = usage.get('completion_tokens', 0)
+                    
+                    # Calculate cost; free models (the default) skip the
+                    # per-call float math entirely.
+                    cost = self._estimate_cost(prompt_tokens, completion_tokens)
+                    
+                    # Track usage and feed the adaptive-timeout window
+                    self.usage_stats.add_usage(prompt_tokens, completion_tokens, cost)
+                    elapsed_s = response.elapsed.total_seconds()
+                    self._latency_samples.append(elapsed_s)
+
+                    # isEnabledFor guard: skip the f-string formatting
+                    # entirely when debug logging is off (the normal case).
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "API call successful (took %.2fs, tokens: %d+%d=%d, cost: $%.4f)",
+                            elapsed_s, prompt_tokens, completion_tokens,
+                            prompt_tokens + completion_tokens, cost,
+                        )
+                    return content
+                except Exception as e:
+                    logger.error(f"Unexpected response format: {e}")
                     self.usage_stats.add_failure()
                     return None
-
-            except requests.exceptions.Timeout:
-                logger.error(f"API request timed out after {self.timeout}s")
-                self.usage_stats.add_failure()
-                return None
-            except requests.exceptions.ConnectionError as e:
-                logger.error(f"Connection error - check internet connection: {e}")
+            
+            elif response.status_code == 429:
+                # Rate limit hit - the retry logic already handled retries
+                logger.warning(f"Rate limit exceeded even after retries: {response.text}")
                 self.usage_stats.add_failure()
                 return None
-            except Exception as e:
-                logger.error(f"API request failed: {e}")
+            
+            else:
+                logger.error(f"API error {response.status_code}: {response.text}")
+                # Try to get error details
+                try:
+                    error_data = response.json()
+                    logger.error(f"API error details: {error_data}")
+                except Exception:
+                    pass
                 self.usage_stats.add_failure()
                 return None
 
+        except requests.exceptions.Timeout:
+            if not _is_retry:
+                # A straggler hit the adaptive cutoff: retry once with the
+                # full flat timeout before counting a failure.
+                logger.warning(f"API request timed out after {timeout:.1f}s, retrying once")
+                return self._make_api_call(prompt, _is_retry=True)
+            logger.error(f"API request timed out after {timeout:.1f}s")
+            self.usage_stats.add_failure()
+            return None
+        except requests.exceptions.ConnectionError as e:
+            logger.error(f"Connection error - check internet connection: {e}")
+            self.usage_stats.add_failure()
+            return None
+        except Exception as e:
+            logger.error(f"API request failed: {e}")
+            self.usage_stats.add_failure()
+            return None
+
     def _parse_ai_response(self, response_text: str) -> Dict[str, Any]:
         """Parse the AI response with better error handling and fallbacks"""
         try:
-            # Clean the response text
-            cleaned_text = response_text.strip()
-
-            # Remove markdown code blocks if present
-            if cleaned_text.startswith('```json'):
-                cleaned_text = cleaned_text[7:]  # Remove ```json
-            elif cleaned_text.startswith('```'):
-                cleaned_text = cleaned_text[3:]  # Remove ```
-            
-            if cleaned_text.endswith('```'):
-                cleaned_text = cleaned_text[:-3]  # Remove ```
-            
-            cleaned_text = cleaned_text.strip()
+            # Strip any markdown fence in a single regex pass instead of
+            # chained startswith/endswith slices, each of which allocated
+            # an intermediate string.
+            m = _FENCE_RE.match(response_text)
+            cleaned_text = m.group(1) if m else response_text.strip()
 
-            # Try to parse JSON
+            # Parse and validate in one pass: model_validate_json feeds
+            # the raw text straight to pydantic-core, skipping the
+            # intermediate json.loads dict and the Python field re-walk.
+            # Invalid JSON surfaces as ValidationError too.
             try:
-                parsed_raw = json.loads(cleaned_text)
-            except json.JSONDecodeError as e:
-                # Try to fix common JSON issues
-                logger.debug(f"Initial JSON parse failed: {e}, attempting cleanup...")
-                
+                validated = AIResponse.model_validate_json(cleaned_text)
+            except ValidationError as ve:
                 # Try to extract JSON object if there's extra text
+                logger.debug("Initial response validation failed, attempting cleanup...")
                 start_idx = cleaned_text.find('{')
                 end_idx = cleaned_text.rfind('}')
-                
-                if start_idx != -1 and end_idx != -1:
-                    cleaned_text = cleaned_text[start_idx:end_idx + 1]
-                    parsed_raw = json.loads(cleaned_text)
-                else:
-                    raise  # Re-raise if we can't fix it
-
-            # Validate using strict Pydantic model
-            try:
-                validated = AIResponse(**parsed_raw)
-            except ValidationError as ve:
-                logger.warning(f"AI response validation failed, using fallback: {ve.errors()}")
-                return self._get_fallback_response()
+
+                if start_idx == -1 or end_idx == -1:
+                    logger.warning(f"AI response validation failed, using fallback: {ve.errors()}")
+                    return self._get_fallback_response()
+                try:
+                    validated = AIResponse.model_validate_json(cleaned_text[start_idx:end_idx + 1])
+                except ValidationError as ve2:
+                    logger.warning(f"AI response validation failed, using fallback: {ve2.errors()}")
+                    return self._get_fallback_response()
 
             # Clamp effort_minutes to a reasonable range
             if validated.effort_minutes < 1 or validated.effort_minutes > 240:
                 validated.effort_minutes = 15
 
-            return validated.dict()
+            # Project only non-None fields: cheaper than model_dump's
+            # full serializer walk, and callers .get with defaults anyway.
+            return {
+                k: v for k in _OUTPUT_KEYS if (v := getattr(validated, k)) is not None
+            }
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.warning(f"Failed to parse AI response as JSON: {e}")
             logger.debug(f"Raw response (first 500 chars): {response_text[:500]}")
             return self._get_fallback_response()
@@ -565,13 +869,8 @@ class SimpleAIClient:
 
     def _get_fallback_response(self) -> Dict[str, Any]:
         """Provide a sensible fallback when AI fails"""
-        return {
-            "priority": "medium",
-            "user_impact": "This accessibility issue may affect users with disabilities.",
-            "fix_suggestion": "Review and fix the accessibility issue following WCAG guidelines.",
-            "code_example": None,
-            "effort_minutes": 15
-        }
+        # Shallow copy of the module constant so callers may mutate theirs
+        return dict(_FALLBACK_RESPONSE)
 
     def test_connection(self) -> bool:
         """Test if the AI API is reachable and working"""
@@ -590,95 +889,183 @@ class SimpleAIClient:
     # =====================================================
     # ASYNC API METHODS (for batch processing)
     # =====================================================
-    
-    async def _make_api_call_async(self, prompt: str, session: aiohttp.ClientSession) -> Optional[str]:
-        """Async version of API call for batch processing"""
-        
-        # Note: Rate limiting is handled at the batch level, not per call
-        # in the async version to allow parallel execution
-        
-        try:
-            async with session.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a web accessibility expert. Always respond with valid JSON."
+
+    async def _get_aio_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use.
+
+        One long-lived session means one TLS connection pool and DNS
+        cache across all async calls; per-call sessions would pay a fresh
+        handshake per request under load.
+        """
+        if self._aio_session is None or self._aio_session.closed:
+            async with self._aio_session_lock:
+                if self._aio_session is None or self._aio_session.closed:
+                    self._aio_session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=64,
+                            limit_per_host=32,
+                            keepalive_timeout=75,
+                            ttl_dns_cache=300,
+                            enable_cleanup_closed=True,
+                        ),
+                        timeout=self._aio_timeout,
+                        # Honor HTTP(S)_PROXY/NO_PROXY like the requests
+                        # session does by default.
+                        trust_env=True,
+                        headers={
+                            "Authorization": f"Bearer {self.api_key}",
+                            "Content-Type": "application/json",
                         },
-                        {"role": "user", "content": prompt}
-                    ],
-                    "max_tokens": 800,
-                    "temperature": 0.1,
-                    "response_format": {"type": "json_object"}
-                },
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                
-                if response.status == 200:
-                    data = await response.json()
-                    try:
-                        choices = data.get('choices') or []
-                        if not choices:
-                            logger.error("API response has no choices field")
-                            self.usage_stats.add_failure()
-                            return None
-                        message = choices[0].get('message') or {}
-                        content = message.get('content')
-                        if not isinstance(content, str):
-                            logger.error("API response content missing or not a string")
-                            self.usage_stats.add_failure()
+                    )
+        return self._aio_session
+
+    async def aclose(self) -> None:
+        """Close the shared async session (call when done with the client)."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+
+    async def __aenter__(self) -> "SimpleAIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _athrottle(self) -> None:
+        """Async variant of _throttle sharing the same token bucket.
+
+        The threading.Lock is safe here because it is only held for the
+        microseconds of the reservation; the wait itself is an awaitable
+        sleep, so concurrent tasks fan out at the target rate while the
+        event loop keeps running.
+        """
+        with self._rate_limiter:
+            now = time.monotonic()
+            wait = max(0.0, self._last_call_time + self._min_interval - now)
+            self._last_call_time = now + wait
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _retry_delay_429(self, headers: Any, attempt: int) -> float:
+        """Backoff before retrying a 429: server hint or exponential+jitter."""
+        retry_after = headers.get("Retry-After")
+        try:
+            server_wait = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            server_wait = 0.0
+        return max(server_wait, _RATE_LIMIT_BASE_DELAY * (2 ** attempt) + random.random() * 0.5)
+
+    async def _pause_on_rate_limit(self, delay: float) -> None:
+        """Close the shared gate for `delay` seconds (one pause per 429 wave).
+
+        The first worker to see a 429 clears the gate, sleeps and reopens
+        it; workers that hit 429 while the gate is already closed just
+        wait for it instead of stacking independent sleeps.
+        """
+        if self._rate_limit_gate.is_set():
+            self._rate_limit_gate.clear()
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._rate_limit_gate.set()
+        else:
+            await self._rate_limit_gate.wait()
+
+    async def _make_api_call_async(self, prompt: str, session: Optional[aiohttp.ClientSession] = None, stats: Optional[Any] = None) -> Optional[str]:
+        """Async version of API call for batch processing.
+
+        Unlike the sync session (where urllib3's Retry handles 429),
+        rate-limit responses here are retried explicitly with backoff,
+        pausing all concurrent workers through the shared gate.
+        """
+        if session is None:
+            session = await self._get_aio_session()
+        # Batch callers pass a lock-free _UsageBatch; standalone calls
+        # record straight into the shared stats.
+        stats = stats if stats is not None else self.usage_stats
+        payload = {
+            **self._payload_tmpl,
+            "messages": [_SYSTEM_MSG, {"role": "user", "content": prompt}],
+        }
+        body = _dumps_bytes(payload)
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            # Wait out any batch-wide 429 pause, then shape to the shared
+            # requests-per-second bucket; the semaphore in
+            # analyze_batch_async only bounds concurrency.
+            await self._rate_limit_gate.wait()
+            await self._athrottle()
+            try:
+                async with session.post(
+                    f"{self.base_url}/chat/completions",
+                    data=body,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self._aio_timeout
+                ) as response:
+
+                    if response.status == 200:
+                        data = _loads(await response.read())
+                        try:
+                            choices = data.get('choices') or []
+                            if not choices:
+                                logger.error("API response has no choices field")
+                                stats.add_failure()
+                                return None
+                            message = choices[0].get('message') or {}
+                            content = message.get('content')
+                            if not isinstance(content, str):
+                                logger.error("API response content missing or not a string")
+                                stats.add_failure()
+                                return None
+
+                            # Extract usage information
+                            usage = data.get('usage', {})
+                            prompt_tokens = usage.get('prompt_tokens', 0)
+                            completion_tokens = usage.get('completion_tokens', 0)
+
+                            total_tokens = prompt_tokens + completion_tokens
+                            cost = self._estimate_cost(prompt_tokens, completion_tokens)
+
+                            # Track usage
+                            stats.add_usage(prompt_tokens, completion_tokens, cost)
+
+                            logger.debug(
+                                "Async API call successful (tokens: %d+%d=%d, cost: $%.4f)",
+                                prompt_tokens, completion_tokens, total_tokens, cost,
+                            )
+                            return content
+                        except Exception as e:
+                            logger.error("Unexpected response format: %s", e)
+                            stats.add_failure()
                             return None
-                        
-                        # Extract usage information
-                        usage = data.get('usage', {})
-                        prompt_tokens = usage.get('prompt_tokens', 0)
-                        completion_tokens = usage.get('completion_tokens', 0)
-                        
-                        # Calculate cost
-                        cost = (
-                            (prompt_tokens / 1_000_000 * self.price_per_1m_prompt_tokens) +
-                            (completion_tokens / 1_000_000 * self.price_per_1m_completion_tokens)
-                        )
-                        
-                        # Track usage
-                        self.usage_stats.add_usage(prompt_tokens, completion_tokens, cost)
-                        
-                        logger.debug(
-                            f"Async API call successful "
-                            f"(tokens: {prompt_tokens}+{completion_tokens}={prompt_tokens+completion_tokens}, "
-                            f"cost: ${cost:.4f})"
-                        )
-                        return content
-                    except Exception as e:
-                        logger.error(f"Unexpected response format: {e}")
-                        self.usage_stats.add_failure()
+
+                    elif response.status == 429:
+                        if attempt < _RATE_LIMIT_RETRIES:
+                            delay = self._retry_delay_429(response.headers, attempt)
+                            logger.warning(
+                                "Rate limited (429), backing off %.1fs (attempt %d/%d)",
+                                delay, attempt + 1, _RATE_LIMIT_RETRIES,
+                            )
+                            await self._pause_on_rate_limit(delay)
+                            continue
+                        logger.warning("Rate limit exceeded after %d retries: %s", _RATE_LIMIT_RETRIES, await response.text())
+                        stats.add_failure()
                         return None
-                
-                elif response.status == 429:
-                    logger.warning(f"Rate limit exceeded: {await response.text()}")
-                    self.usage_stats.add_failure()
-                    return None
-                
-                else:
-                    error_text = await response.text()
-                    logger.error(f"API error {response.status}: {error_text}")
-                    self.usage_stats.add_failure()
-                    return None
 
-        except asyncio.TimeoutError:
-            logger.error(f"Async API request timed out after {self.timeout}s")
-            self.usage_stats.add_failure()
-            return None
-        except Exception as e:
-            logger.error(f"Async API request failed: {e}")
-            self.usage_stats.add_failure()
-            return None
+                    else:
+                        error_text = await response.text()
+                        logger.error("API error %d: %s", response.status, error_text)
+                        stats.add_failure()
+                        return None
+
+            except asyncio.TimeoutError:
+                logger.error("Async API request timed out after %ds", self.timeout)
+                stats.add_failure()
+                return None
+            except Exception as e:
+                logger.error("Async API request failed: %s", e)
+                stats.add_failure()
+                return None
+        return None
 
     async def analyze_accessibility_issue_async(
         self, 
@@ -687,7 +1074,8 @@ class SimpleAIClient:
         impact: Optional[str] = None, 
         rule_id: Optional[str] = None, 
         framework: Optional[str] = None,
-        session: Optional[aiohttp.ClientSession] = None
+        session: Optional[aiohttp.ClientSession] = None,
+        stats: Optional[Any] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Async version of analyze_accessibility_issue for batch processing
@@ -701,12 +1089,8 @@ class SimpleAIClient:
         # Build the prompt (same as sync version)
         prompt = self._build_comprehensive_prompt(issue_description, elements, impact, rule_id, framework)
         
-        # Use provided session or create a new one
-        if session:
-            response_text = await self._make_api_call_async(prompt, session)
-        else:
-            async with aiohttp.ClientSession() as new_session:
-                response_text = await self._make_api_call_async(prompt, new_session)
+        # Use the provided session, or fall back to the shared one
+        response_text = await self._make_api_call_async(prompt, session, stats)
         
         if not response_text:
             return None
@@ -741,30 +1125,69 @@ class SimpleAIClient:
         if not issues:
             return []
         
-        logger.info(f"Starting async batch analysis of {len(issues)} issues (max {max_concurrent} concurrent)")
-        
-        # Create semaphore to limit concurrency
+        logger.info("Starting async batch analysis of %d issues (max %d concurrent)", len(issues), max_concurrent)
+
+        # The semaphore is the one knob controlling inflight requests; the
+        # shared connector's explicit limit_per_host (32) exists so the
+        # pool never silently caps below it. Warn if a caller asks for
+        # more than the pool can actually run in parallel.
+        if max_concurrent > 32:
+            logger.warning(
+                "max_concurrent=%d exceeds the connection pool's per-host limit (32); "
+                "extra requests will queue in the connector", max_concurrent
+            )
         semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def analyze_with_semaphore(issue: Dict[str, Any], session: aiohttp.ClientSession):
-            """Wrapper to control concurrency"""
-            async with semaphore:
-                return await self.analyze_accessibility_issue_async(
-                    issue_description=issue.get("description", ""),
-                    elements=issue.get("elements"),
-                    impact=issue.get("impact"),
-                    rule_id=issue.get("rule_id"),
-                    framework=issue.get("framework"),
-                    session=session
+
+        session = await self._get_aio_session()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(issues)
+        batch_stats = _UsageBatch()
+
+        async def analyze_one(index: int, issue: Dict[str, Any]) -> None:
+            """Analyze one issue, writing its slot in the results list.
+
+            Failures stay isolated to their slot (left as None) so one
+            crashed task never aborts the batch and wastes the spend on
+            every other in-flight request. The wait_for cap is a safety
+            margin past the per-request timeout, covering stalls outside
+            the HTTP call itself (throttle waits, 429 pauses).
+            """
+            try:
+                results[index] = await asyncio.wait_for(
+                    self.analyze_accessibility_issue_async(
+                        issue_description=issue.get("description", ""),
+                        elements=issue.get("elements"),
+                        impact=issue.get("impact"),
+                        rule_id=issue.get("rule_id"),
+                        framework=issue.get("framework"),
+                        session=session,
+                        stats=batch_stats
+                    ),
+                    timeout=self.timeout * (_RATE_LIMIT_RETRIES + 1) + 30,
                 )
-        
-        # Process all issues in parallel with rate limiting via semaphore
-        async with aiohttp.ClientSession() as session:
-            tasks = [analyze_with_semaphore(issue, session) for issue in issues]
-            results = await asyncio.gather(*tasks, return_exceptions=False)
-        
-        logger.info(f"Batch analysis complete. Successful: {sum(1 for r in results if r is not None)}/{len(issues)}")
-        logger.info(f"Current usage stats: {self.get_usage_stats()}")
+            except asyncio.CancelledError:
+                raise  # never swallow cancellation
+            except Exception as e:
+                logger.warning("Batch analysis of issue %d failed: %s", index, e)
+            finally:
+                semaphore.release()
+
+        # Acquire the semaphore *before* create_task: coroutines (and
+        # their request buffers) only come into existence as capacity
+        # frees, so peak memory holds O(max_concurrent) live coroutines
+        # instead of materializing all N up front.
+        tasks = []
+        for index, issue in enumerate(issues):
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(analyze_one(index, issue)))
+        # return_exceptions keeps one failed task from cancelling the rest;
+        # per-task errors were already logged and left as None slots.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # One lock acquire for the whole batch's usage accounting
+        self.usage_stats.merge(batch_stats)
+
+        logger.info("Batch analysis complete. Successful: %d/%d", sum(1 for r in results if r is not None), len(issues))
+        logger.info("Current usage stats: %s", self.get_usage_stats())
         
         return results
 
@@ -1,6 +1,8 @@
+import atexit
 import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 
 
 SCHEMA_SQL = """
@@ -17,67 +19,132 @@ CREATE TABLE IF NOT EXISTS run_summaries (
   estimated_total_time_minutes INTEGER NOT NULL,
   ai_enhanced_issues INTEGER NOT NULL
 );
+CREATE INDEX IF NOT EXISTS idx_run_summaries_ts ON run_summaries(ts DESC);
 """
 
+# Insert statement and the integer columns it binds, built once so SQLite
+# prepares the same statement text from its cache instead of re-parsing a
+# freshly formatted string per call.
+_INSERT_SQL = (
+    "INSERT INTO run_summaries("
+    "ts, url, framework, total_issues, critical_issues, high_issues, "
+    "medium_issues, low_issues, estimated_total_time_minutes, ai_enhanced_issues"
+    ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_COUNT_KEYS = (
+    "total_issues",
+    "critical_issues",
+    "high_issues",
+    "medium_issues",
+    "low_issues",
+    "estimated_total_time_minutes",
+    "ai_enhanced_issues",
+)
+
+
+def _coerce(summary: Dict[str, Any], _int=int, _keys=_COUNT_KEYS) -> tuple:
+    """Pull the seven integer columns out of a summary dict."""
+    get = summary.get
+    return tuple(_int(get(k, 0)) for k in _keys)
+
+
+# One long-lived connection per database path. Reopening the file per
+# call re-ran the PRAGMAs and schema DDL every time, which dwarfs the
+# actual single-row insert; with the cache that setup cost is paid once
+# per process.
+_CONN_CACHE: Dict[str, sqlite3.Connection] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Serializes explicit write transactions on the shared connections so two
+# threads can't interleave BEGIN IMMEDIATE on the same handle.
+_WRITE_LOCK = threading.Lock()
+
 
 def _connect(db_path: Path) -> sqlite3.Connection:
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(str(db_path))
-    con.execute("PRAGMA journal_mode=WAL;")
-    con.execute("PRAGMA synchronous=NORMAL;")
-    con.execute(SCHEMA_SQL)
+    """Return the cached connection for db_path, creating it on first use.
+
+    check_same_thread is disabled because callers (CLI and web handlers)
+    may touch the same database from different threads; CPython's sqlite3
+    serializes access to a connection internally.
+    """
+    key = str(db_path.resolve())
+    with _CACHE_LOCK:
+        con = _CONN_CACHE.get(key)
+        if con is None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode: writes below take the write lock up front
+            # via explicit BEGIN IMMEDIATE instead of sqlite3's implicit
+            # BEGIN DEFERRED, which would only upgrade to a write lock at
+            # the first DML and can hit SQLITE_BUSY under concurrency.
+            con = sqlite3.connect(key, check_same_thread=False, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute("PRAGMA synchronous=NORMAL;")
+            # Larger page cache (20MB), in-memory temp structures and
+            # mmap'd reads keep the hot path memory-bound; busy_timeout
+            # lets concurrent writers wait instead of erroring.
+            con.execute("PRAGMA cache_size=-20000;")
+            con.execute("PRAGMA temp_store=MEMORY;")
+            con.execute("PRAGMA mmap_size=268435456;")
+            con.execute("PRAGMA busy_timeout=5000;")
+            con.executescript(SCHEMA_SQL)
+            # Rows come back as sqlite3.Row: dict(row) uses the C-level
+            # column names instead of a per-row zip of Python tuples.
+            con.row_factory = sqlite3.Row
+            _CONN_CACHE[key] = con
     return con
 
 
-def insert_run(db_path: Path, summary: Dict[str, Any], url: str, framework: str, ts_iso: str) -> None:
+def _close_all() -> None:
+    """Close every cached connection (registered to run at exit)."""
+    with _CACHE_LOCK:
+        for con in _CONN_CACHE.values():
+            try:
+                con.close()
+            except sqlite3.Error:
+                pass
+        _CONN_CACHE.clear()
+
+
+atexit.register(_close_all)
+
+
+def insert_runs_batch(
+    db_path: Path,
+    summaries: Iterable[Dict[str, Any]],
+    url: str,
+    framework: str,
+    ts_iso: str,
+) -> None:
+    """Insert many run summaries in one transaction.
+
+    Each insert_run call is its own implicit transaction and therefore
+    its own WAL fsync; batching N rows under a single commit pays that
+    fsync once, which is where nearly all of the per-row cost goes.
+    """
     con = _connect(db_path)
-    try:
-        con.execute(
-            """
-            INSERT INTO run_summaries (
-                ts, url, framework,
-                total_issues, critical_issues, high_issues, medium_issues, low_issues,
-                estimated_total_time_minutes, ai_enhanced_issues
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                ts_iso,
-                url,
-                framework,
-                int(summary.get("total_issues", 0)),
-                int(summary.get("critical_issues", 0)),
-                int(summary.get("high_issues", 0)),
-                int(summary.get("medium_issues", 0)),
-                int(summary.get("low_issues", 0)),
-                int(summary.get("estimated_total_time_minutes", 0)),
-                int(summary.get("ai_enhanced_issues", 0)),
-            ),
-        )
-        con.commit()
-    finally:
-        con.close()
+    head = (ts_iso, url, framework)
+    with _WRITE_LOCK:
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.executemany(_INSERT_SQL, (head + _coerce(s) for s in summaries))
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+
+
+def insert_run(db_path: Path, summary: Dict[str, Any], url: str, framework: str, ts_iso: str) -> None:
+    insert_runs_batch(db_path, (summary,), url, framework, ts_iso)
 
 
 def list_runs(db_path: Path, limit: int = 200) -> List[Dict[str, Any]]:
     con = _connect(db_path)
-    try:
-        rows = con.execute(
+    return [
+        dict(row)
+        for row in con.execute(
             "SELECT ts, url, framework, total_issues, critical_issues, high_issues, medium_issues, low_issues, estimated_total_time_minutes, ai_enhanced_issues FROM run_summaries ORDER BY ts DESC LIMIT ?",
             (limit,),
-        ).fetchall()
-        cols = [
-            "ts",
-            "url",
-            "framework",
-            "total_issues",
-            "critical_issues",
-            "high_issues",
-            "medium_issues",
-            "low_issues",
-            "estimated_total_time_minutes",
-            "ai_enhanced_issues",
-        ]
-        return [dict(zip(cols, r)) for r in rows]
-    finally:
-        con.close()
+        )
+    ]
 
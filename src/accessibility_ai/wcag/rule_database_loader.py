@@ -7,15 +7,61 @@ Provides instant lookups for common WCAG issues without AI calls.
 
 import json
 import logging
+import os
+import pickle
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+try:  # optional fast parser, same fallback shape as the AI client
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _norm_id(value: str) -> str:
+    """Lowercase/strip and intern a rule or framework identifier.
+
+    Scans repeat the same handful of IDs, so after the first call the
+    canonical interned copy comes straight from the cache and dict
+    lookups against the pre-normalized cache compare by pointer.
+    """
+    return sys.intern(value.lower().strip())
+
+
+def _normalize_rules(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize rule IDs and fix_by_framework keys once at load time.
+
+    Moves the per-call lower/strip work in get_rule and
+    get_fix_for_framework to per-load, leaving the hot lookups as single
+    dict hits on interned keys.
+    """
+    normalized: Dict[str, Any] = {}
+    for rule_id, rule in data.items():
+        if isinstance(rule, dict) and isinstance(rule.get('fix_by_framework'), dict):
+            rule = dict(rule)
+            rule['fix_by_framework'] = {
+                _norm_id(fw): fix for fw, fix in rule['fix_by_framework'].items()
+            }
+        normalized[_norm_id(rule_id)] = rule
+    return normalized
+
+
 class RuleDatabaseLoader:
     """Loads and provides access to WCAG rules database"""
-    
+
+    # Every per-issue lookup goes through these attributes; slots make the
+    # access a fixed-offset load and drop the per-instance __dict__.
+    __slots__ = ('database_path', '_rules_cache', '_rules_ai_required', '_ready')
+
     def __init__(self, database_path: Optional[str] = None):
         """
         Initialize the rule database loader
@@ -30,22 +76,94 @@ class RuleDatabaseLoader:
             self.database_path = Path(__file__).parent / "rules_database.json"
         else:
             self.database_path = Path(database_path)
-        self._rules_cache: Optional[Dict[str, Any]] = None
-        self._load_database()
-    
+        self._rules_cache: Optional[Mapping[str, Any]] = None
+        self._rules_ai_required: frozenset = frozenset()
+        # Load in a daemon thread so import continues (and, with orjson,
+        # the GIL-released parse overlaps other startup work); getters
+        # block on _ready only if called before the load finishes.
+        self._ready = threading.Event()
+        threading.Thread(target=self._load_database_then_set, daemon=True).start()
+
+    def _load_database_then_set(self) -> None:
+        """Run the load, then open the gate for waiting getters."""
+        try:
+            self._load_database()
+        except Exception:
+            logger.exception("Background rules database load failed")
+            self._rules_cache = MappingProxyType({})
+        finally:
+            self._ready.set()
+
     def _load_database(self) -> None:
-        """Load rules database from JSON file into memory"""
+        """Load the rules and precompute the per-issue lookup structures."""
+        # Read-only view: nothing downstream may mutate the shared cache,
+        # and lookups against it keep hitting the interned-key fast path.
+        self._rules_cache = MappingProxyType(self._read_rules())
+        # requires_ai_enhancement runs once per issue in every scan; a
+        # frozenset membership test there replaces a get_rule plus a
+        # dict.get per call.
+        self._rules_ai_required = frozenset(
+            rule_id
+            for rule_id, rule in self._rules_cache.items()
+            if isinstance(rule, dict) and rule.get('requires_ai', False)
+        )
+
+    def _read_rules(self) -> Dict[str, Any]:
+        """Read the rules database from disk, normalized.
+
+        A pickle sidecar next to the JSON is tried first: unpickling a
+        dict-of-dicts goes straight from bytes to objects with no JSON
+        tokenization, so warm process starts skip the parse entirely.
+        The sidecar is rewritten after any successful JSON parse and
+        ignored whenever the JSON file is newer.
+        """
+        sidecar = self.database_path.with_suffix('.pkl')
+        try:
+            json_mtime = self.database_path.stat().st_mtime
+        except OSError:
+            json_mtime = None
+        if json_mtime is not None:
+            try:
+                if sidecar.stat().st_mtime >= json_mtime:
+                    data = pickle.loads(sidecar.read_bytes())
+                    if isinstance(data, dict):
+                        # Re-normalizing is idempotent and restores key
+                        # interning, which unpickling does not preserve.
+                        rules = _normalize_rules(data)
+                        logger.info(f"Loaded {len(rules)} rules from cached sidecar")
+                        return rules
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass  # missing/stale/corrupt sidecar: re-parse the JSON
+
         try:
-            with open(self.database_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._rules_cache = data if isinstance(data, dict) else {}
-            logger.info(f"Loaded {len(self._rules_cache)} rules from database")
+            # Parse the raw bytes: orjson (when installed) skips the
+            # Python-side UTF-8 decode pass entirely, and even the stdlib
+            # fallback avoids text-mode file iteration.
+            data = _loads(self.database_path.read_bytes())
+            rules = _normalize_rules(data) if isinstance(data, dict) else {}
+            logger.info(f"Loaded {len(rules)} rules from database")
         except FileNotFoundError:
             logger.warning(f"Rules database not found at {self.database_path}")
-            self._rules_cache = {}
-        except json.JSONDecodeError as e:
+            return {}
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
             logger.error(f"Failed to parse rules database: {e}")
-            self._rules_cache = {}
+            return {}
+        if rules:
+            self._write_sidecar(sidecar, rules)
+        return rules
+
+    def _write_sidecar(self, sidecar: Path, rules: Dict[str, Any]) -> None:
+        """Atomically persist the parsed rules next to the JSON source.
+
+        Best-effort: read-only installs simply keep re-parsing the JSON.
+        """
+        tmp = sidecar.with_suffix('.pkl.tmp')
+        try:
+            tmp.write_bytes(pickle.dumps(rules, protocol=5))
+            os.replace(tmp, sidecar)
+        except OSError as e:
+            logger.debug(f"Could not write rules sidecar {sidecar}: {e}")
     
     def get_rule(self, rule_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -61,12 +179,13 @@ class RuleDatabaseLoader:
         Optional[Dict[str, Any]]
             Rule data dictionary or None if not found
         """
+        self._ready.wait()
         if self._rules_cache is None:
             return None
-        
-        # Normalize rule ID (lowercase, handle variations)
-        normalized_id = rule_id.lower().strip()
-        return self._rules_cache.get(normalized_id)
+
+        # Keys were normalized at load time; only the input needs the
+        # (cached) lowercase/strip.
+        return self._rules_cache.get(_norm_id(rule_id))
     
     def has_rule(self, rule_id: str) -> bool:
         """Check if rule exists in database"""
@@ -92,15 +211,12 @@ class RuleDatabaseLoader:
         if not rule_data:
             return None
         
-        fixes = rule_data.get('fix_by_framework', {})
-        framework_normalized = framework.lower().strip()
-        
-        # Try exact match first
-        if framework_normalized in fixes:
-            return fixes[framework_normalized]
-        
-        # Fallback to html if framework not found
-        return fixes.get('html')
+        fixes = rule_data.get('fix_by_framework')
+        if not fixes:
+            return None
+
+        # Subdict keys were normalized at load; exact match, else html
+        return fixes.get(_norm_id(framework)) or fixes.get('html')
     
     def get_effort_estimate(self, rule_id: str) -> int:
         """Get estimated effort in minutes to fix this issue"""
@@ -126,10 +242,10 @@ class RuleDatabaseLoader:
         bool
             True if AI enhancement recommended, False if rule DB is sufficient
         """
-        rule_data = self.get_rule(rule_id)
-        if not rule_data:
-            return True  # Unknown rules should use AI
-        return rule_data.get('requires_ai', False)
+        self._ready.wait()
+        nid = _norm_id(rule_id)
+        # Unknown rules should use AI; known rules consult the precomputed set
+        return nid not in self._rules_cache or nid in self._rules_ai_required
     
     def get_wcag_references(self, rule_id: str) -> list:
         """Get WCAG success criteria references for this rule"""
@@ -147,12 +263,14 @@ class RuleDatabaseLoader:
     
     def get_all_rule_ids(self) -> list:
         """Get list of all rule IDs in database"""
+        self._ready.wait()
         if self._rules_cache is None:
             return []
         return list(self._rules_cache.keys())
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the rules database"""
+        self._ready.wait()
         if self._rules_cache is None:
             return {'total_rules': 0, 'requires_ai': 0, 'rule_based': 0}
         
@@ -167,13 +285,12 @@ class RuleDatabaseLoader:
         }
 
 
-# Global instance for easy access
-_global_loader: Optional[RuleDatabaseLoader] = None
+# Global instance, constructed eagerly at import so every call site
+# shares one loaded cache and get_rule_database is a bare name return
+# with no None check per call.
+_global_loader = RuleDatabaseLoader()
 
 
 def get_rule_database() -> RuleDatabaseLoader:
     """Get the global rule database loader instance"""
-    global _global_loader
-    if _global_loader is None:
-        _global_loader = RuleDatabaseLoader()
     return _global_loader